@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import signal
 import subprocess
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
@@ -14,10 +17,11 @@ from .config import AppConfig
 from .container import Container
 from .cli_formatter import format_analyze_result, format_vulnerability_list
 from ..core.domain.exceptions import GHSANotFoundError
-from ..core.domain.models import Vulnerability
-from ..core.usecases.mcp import MCPUseCase
-from ..infra.llm import LLM
-from ..infra.mcp_server import MCPServer
+from ..infra.mcp.tunnel import Tunnel
+
+if TYPE_CHECKING:
+    from ..core.domain.models import Vulnerability
+    from ..core.ports import RepositoryPort
 
 try:
     from dotenv import load_dotenv
@@ -28,11 +32,48 @@ except ImportError:
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
 
+def _create_container(config: AppConfig, *, init_resources: bool = True) -> Container:
+    """Build a container from config and optionally initialize its resources.
+
+    One container per command invocation: the logger resource is bound to
+    ``config.runtime.ghsa``, so containers are not shared across runs.
+    Commands whose use cases never touch the logger pass
+    ``init_resources=False``; a resource is still started on first use.
+    """
+    container = Container()
+    container.config.from_pydantic(config)
+    if init_resources:
+        container.init_resources()
+    return container
+
+
+# Max batch candidates whose repositories are cloned/prepared ahead in parallel
+_PREFETCH_AHEAD = 4
+
+# Env var through which batch hands its shared tunnel URL to analyze subprocesses
+_PUBLIC_URL_ENV = "MISPATCH_FINDER_ANALYSIS__PUBLIC_URL"
+
+
+def _prefetch_workdirs(repo: RepositoryPort, vuln: Vulnerability) -> None:
+    """Clone/prepare a candidate's workdirs ahead of its analyze subprocess.
+
+    Best effort: on failure the analyze subprocess retries and reports the error.
+    """
+    try:
+        repo.prepare_workdirs(
+            repo_url=vuln.repository.url,
+            commit=vuln.commit_hash,
+            force_reclone=False,
+        )
+    except Exception:
+        logging.getLogger(__name__).debug("prefetch failed for %s", vuln.ghsa_id, exc_info=True)
+
+
 @app.command()
 def analyze(
     ghsa: str = typer.Argument(..., help="GHSA identifier, e.g., GHSA-xxxx-xxxx-xxxx"),
-    provider: str = typer.Option("openai", '--provider', case_sensitive=False, help="LLM provider"),
-    model: str = typer.Option("gpt-5", '--model', help="Model name"),
+    provider: str | None = typer.Option(None, '--provider', case_sensitive=False, help="LLM provider (defaults to config)"),
+    model: str | None = typer.Option(None, '--model', help="Model name (defaults to config)"),
     log_level: str = typer.Option("INFO", '--log-level', help="Log level", case_sensitive=False),
     force_reclone: bool = typer.Option(False, '--force-reclone', help="Force re-clone repo cache"),
     json_output: bool = typer.Option(False, '--json', help="Output result as JSON"),
@@ -49,39 +90,40 @@ def analyze(
     config.runtime.ghsa = ghsa
     config.logging.console_output = True  # Enable console output in CLI
 
+    # Apply only the CLI LLM overrides the user passed (env/config values stay
+    # otherwise), so the container is populated in a single from_pydantic pass
+    llm_overrides = {
+        key: value
+        for key, value in (("provider_name", provider), ("model_name", model))
+        if value is not None
+    }
+    if llm_overrides:
+        config.llm = config.llm.model_copy(update=llm_overrides)
+
     # User-facing status messages
     log_file = config.directories.logs_dir / f"{ghsa}.jsonl"
     if log_file.exists():
         log_file.unlink()
 
     typer.echo(f"Starting analysis: {ghsa}")
-    typer.echo(f"Provider: {provider}, Model: {model}")
+    typer.echo(f"Provider: {config.llm.provider_name}, Model: {config.llm.model_name}")
     typer.echo(f"Log file: {log_file}")
 
-    # Validate required secrets
-    if not config.llm.api_key:
-        typer.echo("Error: API key required via MISPATCH_FINDER_LLM__API_KEY", err=True)
-        raise typer.Exit(code=2)
-
-    if not config.github.token:
-        typer.echo("Error: GitHub token required via MISPATCH_FINDER_GITHUB__TOKEN", err=True)
+    # Validate required secrets in one pass (reports every missing secret at once)
+    missing_secrets = [
+        f"Error: {label} required via {env_var}"
+        for value, label, env_var in (
+            (config.llm.api_key, "API key", "MISPATCH_FINDER_LLM__API_KEY"),
+            (config.github.token, "GitHub token", "MISPATCH_FINDER_GITHUB__TOKEN"),
+        )
+        if not value
+    ]
+    if missing_secrets:
+        typer.echo("\n".join(missing_secrets), err=True)
         raise typer.Exit(code=2)
 
     # Create container and execute
-    container = Container()
-    container.config.from_pydantic(config)
-    container.init_resources()
-
-    # Override LLM config with CLI params
-    if provider or model:
-        llm = LLM(
-            provider=provider,
-            model=model,
-            api_key=config.llm.api_key,
-            logger=container.logger(),
-        )
-        orchestrator = container.analysis_orchestrator()
-        orchestrator._llm = llm
+    container = _create_container(config)
 
     # Execute use case
     uc = container.analyze_uc()
@@ -90,19 +132,7 @@ def analyze(
 
         # Output in requested format
         if json_output:
-            # Convert AnalysisResult to dict for JSON serialization
-            result_dict = {
-                "ghsa": result.ghsa,
-                "provider": result.provider,
-                "model": result.model,
-                "verdict": result.verdict,
-                "severity": result.severity,
-                "rationale": result.rationale,
-                "evidence": result.evidence,
-                "poc_idea": result.poc_idea,
-                "raw_text": result.raw_text,
-            }
-            typer.echo(json.dumps(result_dict, ensure_ascii=False, indent=2))
+            typer.echo(json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
         else:
             typer.echo(format_analyze_result(result))
 
@@ -139,9 +169,7 @@ def list_command(
     """
     # Create container
     config = AppConfig()
-    container = Container()
-    container.config.from_pydantic(config)
-    container.init_resources()
+    container = _create_container(config, init_resources=False)
 
     # Handle filter: None = use default, "" = no filter, otherwise = custom
     if no_filter:
@@ -149,13 +177,13 @@ def list_command(
     elif filter_expr is not None:
         actual_filter = None if filter_expr == "" else filter_expr
     else:
-        actual_filter = container.config.vulnerability.filter_expr()
+        actual_filter = config.vulnerability.filter_expr
 
     # Execute use case (business logic is now in UseCase)
     uc = container.list_uc()
     items = uc.execute(
         limit=limit,
-        ecosystem=container.config.vulnerability.ecosystem(),
+        ecosystem=config.vulnerability.ecosystem,
         detailed=detail,
         filter_expr=actual_filter,
         include_analyzed=include_analyzed,
@@ -163,13 +191,8 @@ def list_command(
 
     # Output results
     if not detail:
-        # Execute with detailed=False -> returns list[str]
-        ghsa_ids: list[str] = uc.execute(
-            limit=10,
-            ecosystem=container.config.vulnerability.ecosystem(),
-            detailed=False,
-            filter_expr=actual_filter,
-        )  # type: ignore[assignment]
+        # items is list[str] (detailed=False)
+        ghsa_ids: list[str] = items  # type: ignore[assignment]
 
         # Output in requested format
         if json_output:
@@ -232,12 +255,10 @@ def logs(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed MCP call counts per tool."),
 ):
     """Show analysis logs - either for a specific GHSA or summary of all runs."""
-    # Create container and execute
+    # Resources stay uninitialized: only the analysis store is resolved, and
+    # heavy adapters are deferred imports, so the DI graph costs next to nothing
     config = AppConfig()
-    container = Container()
-    container.config.from_pydantic(config)
-    container.init_resources()
-
+    container = _create_container(config, init_resources=False)
     uc = container.logs_uc()
     lines = uc.execute(ghsa, verbose)
 
@@ -253,9 +274,7 @@ def prompt(
     """Display the raw analysis prompt for a given GHSA."""
     # Create container and execute
     config = AppConfig()
-    container = Container()
-    container.config.from_pydantic(config)
-    container.init_resources()
+    container = _create_container(config, init_resources=False)
 
     try:
         uc = container.prompt_uc()
@@ -281,6 +300,10 @@ def batch(
     By default, applies filter (stars>=100, size<=10MB) to focus on relevant repos.
     Use --filter to specify custom criteria or --no-filter to process all vulnerabilities.
 
+    Upcoming candidates' repositories are cloned in the background (up to 4 ahead).
+    On failure or Ctrl-C, queued clones are dropped but in-flight ones finish
+    before the process exits.
+
     Examples:
       mispatch-finder batch --limit 10                           # Process 10 filtered vulnerabilities
       mispatch-finder batch --filter "severity == 'CRITICAL'"   # Only critical severity
@@ -291,9 +314,7 @@ def batch(
 
     # Create container
     config = AppConfig()
-    container = Container()
-    container.config.from_pydantic(config)
-    container.init_resources()
+    container = _create_container(config, init_resources=False)
 
     # Handle filter
     if no_filter:
@@ -301,13 +322,13 @@ def batch(
     elif filter_expr is not None:
         actual_filter = None if filter_expr == "" else filter_expr
     else:
-        actual_filter = container.config.vulnerability.filter_expr()
+        actual_filter = config.vulnerability.filter_expr
 
     # Fetch pending vulnerabilities (business logic is now in UseCase)
     uc = container.list_uc()
     candidates: list[Vulnerability] = uc.execute(
         limit=limit,
-        ecosystem=container.config.vulnerability.ecosystem(),
+        ecosystem=config.vulnerability.ecosystem,
         detailed=True,
         filter_expr=actual_filter,
         include_analyzed=False,  # Only fetch pending (not yet analyzed)
@@ -326,52 +347,100 @@ def batch(
     processed = 0
     skipped = 0
 
-    for candidate_idx, vuln in enumerate(candidates, start=1):
-        # Check if we've reached the limit
-        if limit and processed >= limit:
-            break
-
-        ghsa = vuln.ghsa_id
-        typer.echo(f"[{candidate_idx}/{len(candidates)}] {ghsa} - {vuln.repository.owner}/{vuln.repository.name}")
-
-        # Status line with optional provider/model context
-        parts = [f"  Running {ghsa}"]
-        if provider:
-            parts.append(f"provider={provider}")
-        if model:
-            parts.append(f"model={model}")
-        typer.echo(" ".join(parts))
-
-        # Build subprocess command
-        cmd = [
-            sys.executable,
-            "-m",
-            "mispatch_finder.app.cli",
-            "analyze",
-            ghsa,
-        ]
-        if provider:
-            cmd.extend(["--provider", provider])
-        if model:
-            cmd.extend(["--model", model])
-
-        # Suppress stdout, keep stderr for errors
-        result = subprocess.run(
-            cmd,
-            cwd=str(src_dir),
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+    # Prepare upcoming candidates' repositories while the current one is analyzed
+    # (bounded lookahead, cloned in parallel): each analyze subprocess then finds
+    # its clone/workdirs already in the cache
+    repo = container.repo()
+    prefetch_pool = ThreadPoolExecutor(max_workers=_PREFETCH_AHEAD)
+    prefetches: list[Future[None]] = []
 
-        if result.returncode != 0:
-            typer.echo(f"  ✗ Failed with exit code {result.returncode}", err=True)
-            if result.stderr:
-                typer.echo(result.stderr, err=True)
-            raise typer.Exit(code=1)
-        else:
-            typer.echo(f"  ✓ Completed")
-            processed += 1
+    # One tunnel for the whole batch: every analyze subprocess serves MCP on the
+    # same fixed port in turn, so they share this public URL instead of each
+    # opening (and waiting for) its own ssh tunnel
+    tunnel: Tunnel | None = None
+    run_env = os.environ.copy()
+
+    try:
+        for candidate_idx, vuln in enumerate(candidates, start=1):
+            # Check if we've reached the limit
+            if limit and processed >= limit:
+                break
+
+            # Keep this candidate plus the next few in flight, never more than
+            # the runs still needed to reach --limit
+            remaining = limit - processed if limit else len(candidates)
+            window_end = min(len(candidates), candidate_idx - 1 + min(_PREFETCH_AHEAD, remaining))
+            while len(prefetches) < window_end:
+                prefetches.append(
+                    prefetch_pool.submit(_prefetch_workdirs, repo, candidates[len(prefetches)])
+                )
+            prefetches[candidate_idx - 1].result()
+
+            ghsa = vuln.ghsa_id
+
+            # Status line with optional provider/model context
+            parts = [f"  Running {ghsa}"]
+            if provider:
+                parts.append(f"provider={provider}")
+            if model:
+                parts.append(f"model={model}")
+
+            # Emit header + status as a single write (one flush per candidate)
+            typer.echo("\n".join([
+                f"[{candidate_idx}/{len(candidates)}] {ghsa} - {vuln.repository.owner}/{vuln.repository.name}",
+                " ".join(parts),
+            ]))
+
+            # (Re)open the shared tunnel unless one was configured externally
+            if config.analysis.public_url is None and (tunnel is None or not tunnel.is_alive()):
+                if tunnel is not None:
+                    tunnel.stop_tunnel()
+                    tunnel = None
+                try:
+                    run_env[_PUBLIC_URL_ENV], tunnel = Tunnel.start_tunnel("127.0.0.1", config.analysis.mcp_port)
+                except RuntimeError as e:
+                    typer.echo(f"  ✗ Failed to start tunnel: {e}", err=True)
+                    raise typer.Exit(code=1)
+
+            # Build subprocess command
+            cmd = [
+                sys.executable,
+                "-m",
+                "mispatch_finder.app.cli",
+                "analyze",
+                ghsa,
+            ]
+            if provider:
+                cmd.extend(["--provider", provider])
+            if model:
+                cmd.extend(["--model", model])
+
+            # Suppress stdout, keep stderr for errors
+            result = subprocess.run(
+                cmd,
+                cwd=str(src_dir),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=run_env,
+            )
+
+            if result.returncode != 0:
+                error_lines = [f"  ✗ Failed with exit code {result.returncode}"]
+                if result.stderr:
+                    error_lines.append(result.stderr)
+                typer.echo("\n".join(error_lines), err=True)
+                raise typer.Exit(code=1)
+            else:
+                typer.echo(f"  ✓ Completed")
+                processed += 1
+    finally:
+        if tunnel is not None:
+            tunnel.stop_tunnel()
+        # Drop prefetches that haven't started; ones already cloning (at most
+        # _PREFETCH_AHEAD) still run to completion, since pool threads are
+        # joined at interpreter exit, so exit can wait on them
+        prefetch_pool.shutdown(wait=False, cancel_futures=True)
 
     typer.echo(f"\nBatch analysis complete: {processed} processed, {skipped} skipped.")
 
@@ -422,20 +491,10 @@ def mcp(
 
     # Create container
     config = AppConfig()
-    container = Container()
-    container.config.from_pydantic(config)
-    container.init_resources()
-
-    # Create MCP server
-    mcp_server = MCPServer(logger=container.logger())
+    container = _create_container(config)
 
     # Execute use case
-    uc = MCPUseCase(
-        mcp_server=mcp_server,
-        vuln_data=container.vuln_data(),
-        repo=container.repo(),
-        token_gen=container.token_gen(),
-    )
+    uc = container.mcp_uc()
 
     # Display startup info (only for streamable-http)
     if mode == "streamable-http":
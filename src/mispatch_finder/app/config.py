@@ -1,63 +1,101 @@
 from __future__ import annotations
 
+import os
+from functools import cache, cached_property
 from pathlib import Path
+from typing import Any, Final, Mapping, Self
 
 from platformdirs import PlatformDirs
-from pydantic import Field, computed_field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, computed_field, field_validator
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
 
 APP_NAME = "mispatch_finder"
 
+_DEFAULT_FILTER_EXPR: Final[str] = (
+    "stars is not None and stars>=100 and size_bytes is not None and size_bytes<=10_000_000"
+)
 
+
+@cache
 def _default_home() -> Path:
-    """Get default home directory using platformdirs."""
+    """Get default home directory using platformdirs (resolved once per process)."""
     return Path(PlatformDirs(appname=APP_NAME, appauthor=False).user_cache_dir)
 
 
 class DirectoryConfig(BaseSettings):
-    """Directory configuration with computed paths."""
+    """Directory configuration with computed paths.
+
+    All data directories are created together on first access (one bootstrap
+    pass) and cached per instance, so later lookups are plain attribute loads.
+    """
+
+    model_config = SettingsConfigDict(frozen=True)
 
     home: Path = Field(
         default_factory=_default_home,
         description="Base directory for all mispatch_finder data",
     )
 
+    @field_validator("home", mode="after")
+    @classmethod
+    def _expand_home(cls, value: Path) -> Path:
+        """Expand ``$VARS`` then ``~`` once at load time (e.g. ``~/data/$USER``)."""
+        return Path(os.path.expandvars(value)).expanduser()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the config, dropping cached paths when ``home`` may have changed.
+
+        ``cached_property`` values live in the instance ``__dict__``, which
+        pydantic copies verbatim, so they would still point at the old home.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in ("_dirs", "cache_dir", "results_dir", "logs_dir"):
+                copied.__dict__.pop(name, None)
+        return copied
+
+    @cached_property
+    def _dirs(self) -> dict[str, Path]:
+        """Create cache/results/logs under home once and return their paths."""
+        # Walk/create the parent chain once, then create each leaf directly
+        self.home.mkdir(parents=True, exist_ok=True)
+        dirs = {name: self.home / name for name in ("cache", "results", "logs")}
+        for path in dirs.values():
+            path.mkdir(exist_ok=True)
+        return dirs
+
     @computed_field
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         """Cache directory for cloned repositories."""
-        path = self.home / "cache"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._dirs["cache"]
 
     @computed_field
-    @property
+    @cached_property
     def results_dir(self) -> Path:
         """Results directory for analysis outputs."""
-        path = self.home / "results"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._dirs["results"]
 
     @computed_field
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Logs directory for analysis logs."""
-        path = self.home / "logs"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return self._dirs["logs"]
 
 
 class VulnerabilityConfig(BaseSettings):
     """Vulnerability filtering configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     ecosystem: str = Field(
         default="npm",
         description="Target vulnerability ecosystem (npm, pypi, Maven, Go, etc.)",
     )
 
     filter_expr: str = Field(
-        default="stars is not None and stars>=100 and size_bytes is not None and size_bytes<=10_000_000",
+        default=_DEFAULT_FILTER_EXPR,
         description=(
             "Default filter expression for vulnerability listing. "
             "Available variables: ghsa_id, cve_id, severity, stars, size_bytes, etc. "
@@ -65,10 +103,18 @@ class VulnerabilityConfig(BaseSettings):
         ),
     )
 
+    list_default_limit: int = Field(
+        default=10,
+        gt=0,
+        description="Default number of vulnerabilities returned by list when no limit is given",
+    )
+
 
 class LLMConfig(BaseSettings):
     """LLM configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     api_key: str | None = Field(
         default=None,
         description="LLM API key (supports OpenAI, Anthropic, etc.)",
@@ -88,6 +134,8 @@ class LLMConfig(BaseSettings):
 class GitHubConfig(BaseSettings):
     """GitHub configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     token: str | None = Field(
         default=None,
         description="GitHub personal access token",
@@ -95,10 +143,16 @@ class GitHubConfig(BaseSettings):
 
 
 class AnalysisConfig(BaseSettings):
-    """Analysis-specific settings."""
+    """Analysis-specific settings.
+
+    Frozen: values are validated once at load time and never change at runtime.
+    """
+
+    model_config = SettingsConfigDict(frozen=True)
 
     diff_max_chars: int = Field(
         default=200_000,
+        gt=0,
         description="Maximum diff characters to include in LLM prompt (middle-truncated if exceeded)",
     )
 
@@ -107,6 +161,11 @@ class AnalysisConfig(BaseSettings):
         description="Port number for MCP server",
     )
 
+    public_url: str | None = Field(
+        default=None,
+        description="Existing public URL that forwards to mcp_port; when set, analyze skips starting its own tunnel",
+    )
+
 
 class LoggingConfig(BaseSettings):
     """Logging configuration."""
@@ -143,6 +202,18 @@ class RuntimeConfig(BaseSettings):
         description="Current GHSA being analyzed (set by CLI/application layer)",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Use init values only - skip the os.environ/dotenv scan on every construction."""
+        return (init_settings,)
+
 
 class AppConfig(BaseSettings):
     """Root application configuration.
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from importlib import import_module
+from typing import Any, Callable
+
 from dependency_injector import containers, providers
 
-from .config import AppConfig
 from ..core.ports import DefaultTokenGenerator
 from ..core.usecases.analyze import AnalyzeUseCase
 from ..core.usecases.list import ListUseCase
@@ -11,30 +13,47 @@ from ..core.usecases.logs import LogsUseCase
 from ..core.usecases.mcp import MCPUseCase
 from ..core.usecases.prompt import PromptUseCase
 from ..core.services import DiffService, JsonExtractor, AnalysisOrchestrator
-from ..infra.vulnerability_data import VulnerabilityDataAdapter
-from ..infra.repository import Repository
-from ..infra.mcp_server import MCPServer
-from ..infra.llm import LLM
 from ..infra.analysis_store import AnalysisStore
 from ..infra.cache import Cache
 from ..infra.logging import AnalysisLogger
 
 
+def _resolve(target: str) -> Any:
+    """Import ``"module:attr"`` and return the attribute."""
+    module_name, _, attr = target.partition(":")
+    return getattr(import_module(module_name), attr)
+
+
+def _deferred(target: str) -> Callable[..., Any]:
+    """Return a factory that imports ``"module:attr"`` only when first called.
+
+    Heavy adapters (cve_collector/httpx, GitPython, fastmcp, LLM SDKs) are wired
+    through this so commands that never resolve them (e.g. ``logs``, ``--help``)
+    skip their import cost.
+    """
+
+    def _factory(*args: Any, **kwargs: Any) -> Any:
+        return _resolve(target)(*args, **kwargs)
+
+    return _factory
+
+
 class Container(containers.DeclarativeContainer):
     """DI container with Pydantic BaseSettings support."""
 
-    # Configuration - supports Pydantic models
-    config = providers.Configuration(pydantic_settings=[AppConfig()])
+    # Configuration - populated by callers via config.from_pydantic(AppConfig())
+    # (not built here, so importing this module doesn't read env or create dirs)
+    config = providers.Configuration()
 
     # Adapters with injected config
     vuln_data = providers.Singleton(
-        VulnerabilityDataAdapter,
+        _deferred("mispatch_finder.infra.vulnerability_data:VulnerabilityDataAdapter"),
         github_token=config.github.token,
         cache_dir=config.directories.cache_dir,
     )
 
     repo = providers.Singleton(
-        Repository,
+        _deferred("mispatch_finder.infra.repository:Repository"),
         cache_dir=config.directories.cache_dir,
     )
 
@@ -62,13 +81,13 @@ class Container(containers.DeclarativeContainer):
 
     # MCP Server (now with logger injection)
     mcp_server = providers.Factory(
-        MCPServer,
+        _deferred("mispatch_finder.infra.mcp_server:MCPServer"),
         logger=logger,
     )
 
     # LLM adapter (now with logger injection)
-    llm = providers.Factory(
-        LLM,
+    llm = providers.Singleton(
+        _deferred("mispatch_finder.infra.llm:LLM"),
         provider=config.llm.provider_name,
         model=config.llm.model_name,
         api_key=config.llm.api_key,
@@ -76,7 +95,7 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Domain services
-    diff_service = providers.Factory(
+    diff_service = providers.Singleton(
         DiffService,
         repo=repo,
         max_chars=config.analysis.diff_max_chars,
@@ -84,7 +103,7 @@ class Container(containers.DeclarativeContainer):
 
     json_extractor = providers.Singleton(JsonExtractor)
 
-    analysis_orchestrator = providers.Factory(
+    analysis_orchestrator = providers.Singleton(
         AnalysisOrchestrator,
         vuln_data=vuln_data,
         repo=repo,
@@ -95,32 +114,34 @@ class Container(containers.DeclarativeContainer):
         diff_service=diff_service,
         json_extractor=json_extractor,
         mcp_port=config.analysis.mcp_port,
+        public_url=config.analysis.public_url,
     )
 
     # Use cases
-    analyze_uc = providers.Factory(
+    analyze_uc = providers.Singleton(
         AnalyzeUseCase,
         orchestrator=analysis_orchestrator,
     )
 
-    list_uc = providers.Factory(
+    list_uc = providers.Singleton(
         ListUseCase,
         vuln_data=vuln_data,
         analysis_store=analysis_store,
+        default_limit=config.vulnerability.list_default_limit,
     )
 
-    clear_cache_uc = providers.Factory(
+    clear_cache_uc = providers.Singleton(
         ClearCacheUseCase,
         cache=cache,
         vuln_data=vuln_data,
     )
 
-    logs_uc = providers.Factory(
+    logs_uc = providers.Singleton(
         LogsUseCase,
         analysis_store=analysis_store,
     )
 
-    mcp_uc = providers.Factory(
+    mcp_uc = providers.Singleton(
         MCPUseCase,
         mcp_server=mcp_server,
         vuln_data=vuln_data,
@@ -128,9 +149,11 @@ class Container(containers.DeclarativeContainer):
         token_gen=token_gen,
     )
 
-    prompt_uc = providers.Factory(
+    prompt_uc = providers.Singleton(
         PromptUseCase,
         vuln_data=vuln_data,
         repo=repo,
         diff_service=diff_service,
+        # Resolved lazily: the constant lives next to the fastmcp-based tool
+        batch_tool=providers.Callable(_resolve, "mispatch_finder.infra.mcp.batch:BATCH_TOOL_NAME"),
     )
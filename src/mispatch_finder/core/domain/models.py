@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Repository:
     """Repository metadata for vulnerability analysis.
 
@@ -17,18 +17,17 @@ class Repository:
     star_count: int | None = None
     size_kb: int | None = None  # Repository size in KB
 
-    @property
-    def slug(self) -> str:
-        """Returns owner/name format."""
-        return f"{self.owner}/{self.name}"
+    # Derived once at construction (frozen + slots rules out cached_property)
+    slug: str = field(init=False, repr=False, compare=False)  # owner/name format
+    url: str = field(init=False, repr=False, compare=False)  # GitHub HTTPS URL
 
-    @property
-    def url(self) -> str:
-        """Returns GitHub HTTPS URL."""
-        return f"https://github.com/{self.slug}"
+    def __post_init__(self) -> None:
+        slug = f"{self.owner}/{self.name}"
+        object.__setattr__(self, "slug", slug)
+        object.__setattr__(self, "url", f"https://github.com/{slug}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Vulnerability:
     """Core vulnerability domain model.
 
@@ -45,7 +44,7 @@ class Vulnerability:
     severity: str | None = None  # e.g., "CRITICAL", "HIGH", "MEDIUM", "LOW"
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoContext:
     repo_url: str
     workdir_current: Path | None
@@ -54,7 +53,7 @@ class RepoContext:
     parent_commit: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     ghsa: str
     provider: str
@@ -66,4 +65,16 @@ class AnalysisResult:
     poc_idea: str | None
     raw_text: str | None
 
-
+    def to_dict(self) -> dict[str, object]:
+        """Return a shallow field dict (no dataclasses.asdict deep copy)."""
+        return {
+            "ghsa": self.ghsa,
+            "provider": self.provider,
+            "model": self.model,
+            "verdict": self.verdict,
+            "severity": self.severity,
+            "rationale": self.rationale,
+            "evidence": self.evidence,
+            "poc_idea": self.poc_idea,
+            "raw_text": self.raw_text,
+        }
@@ -1,5 +1,51 @@
 from __future__ import annotations
 
+from typing import Final
+
+# Instruction blocks shared by every prompt; only the header, the optional
+# batch-tool hint and the diff vary per GHSA.
+_STATES_BODY: Final[str] = (
+    "# Repository States\n"
+    "- 'previous': Code state BEFORE the patch (parent commit of the patched commit)\n"
+    "- 'current': Latest version of the repository (HEAD), NOT necessarily the patched commit\n\n"
+    "Available tools are read-only repository tools for both states.\n"
+)
+_TASK_BODY: Final[str] = (
+    "\n# Assessment Task\n"
+    "1) **Patch Risk Assessment**: Evaluate whether the patch adequately addressed the vulnerability.\n"
+    "   - Compare 'previous' (vulnerable code) with the patch diff\n"
+    "   - Rate: \"good\" (adequate fix) | \"low\" | \"medium\" | \"high\" (inadequate/incomplete fix)\n\n"
+    "2) **Current Risk Assessment**: Determine if the vulnerability risk persists in the latest version.\n"
+    "   - If patch was adequate (patch_risk = \"good\"), current_risk is typically \"good\"\n"
+    "   - However, even if the patch was good, current_risk may not be \"good\" if:\n"
+    "     * The patch was later reverted or removed\n"
+    "     * Subsequent changes re-introduced the vulnerability\n"
+    "     * The patched code was refactored in a way that broke the fix\n"
+    "   - If patch was inadequate, check 'current' state to see if the vulnerability still exists\n"
+    "   - Rate: \"good\" (no risk) | \"low\" | \"medium\" | \"high\" (risk persists)\n\n"
+    "3) **Proof of Concept**: Required ONLY if current_risk is not \"good\".\n"
+    "   - Provide exploit code or detailed steps demonstrating the vulnerability in the 'current' state\n"
+    "   - Omit this field if current_risk is \"good\"\n\n"
+    "Respond in JSON only with fields: {\n"
+    "  \"patch_risk\": \"good\" | \"low\" | \"medium\" | \"high\",\n"
+    "  \"current_risk\": \"good\" | \"low\" | \"medium\" | \"high\",\n"
+    "  \"reason\": string,\n"
+    "  \"poc\"?: string  // Required only if current_risk != \"good\"\n"
+    "}\n"
+)
+
+# Tool-availability line + states body for each (has_previous, has_current)
+# combination, so a call only formats the per-GHSA fields
+_STATE_BODIES: Final[dict[tuple[bool, bool], str]] = {
+    (has_previous, has_current): (
+        f"Previous-state tools: {'available' if has_previous else 'unavailable (no parent commit)'}; "
+        f"Current-state tools: {'available' if has_current else 'unavailable'}.\n\n"
+        + _STATES_BODY
+    )
+    for has_previous in (False, True)
+    for has_current in (False, True)
+}
+
 
 def build_prompt(
     *,
@@ -9,43 +55,24 @@ def build_prompt(
     has_previous: bool,
     has_current: bool,
     diff_text: str,
+    batch_tool: str | None = None,
 ) -> str:
-    """Build analysis prompt with GHSA context and diff."""
-    previous_note = "available" if has_previous else "unavailable (no parent commit)"
-    current_note = "available" if has_current else "unavailable"
+    """Build analysis prompt with GHSA context and diff.
 
-    body = (
+    ``batch_tool`` names the MCP server's tool for bundling several calls into
+    one request, if it exposes one; the prompt then points the model at it.
+    """
+    header = (
         f"You are a security reviewer assessing patch correctness for GHSA {ghsa}.\n"
         f"Repository: {repo_url}\n"
         f"Patched commit: {commit}\n"
-        f"Previous-state tools: {previous_note}; Current-state tools: {current_note}.\n\n"
-        "# Repository States\n"
-        "- 'previous': Code state BEFORE the patch (parent commit of the patched commit)\n"
-        "- 'current': Latest version of the repository (HEAD), NOT necessarily the patched commit\n\n"
-        "Available tools are read-only repository tools for both states.\n\n"
-        "# Assessment Task\n"
-        "1) **Patch Risk Assessment**: Evaluate whether the patch adequately addressed the vulnerability.\n"
-        "   - Compare 'previous' (vulnerable code) with the patch diff\n"
-        "   - Rate: \"good\" (adequate fix) | \"low\" | \"medium\" | \"high\" (inadequate/incomplete fix)\n\n"
-        "2) **Current Risk Assessment**: Determine if the vulnerability risk persists in the latest version.\n"
-        "   - If patch was adequate (patch_risk = \"good\"), current_risk is typically \"good\"\n"
-        "   - However, even if the patch was good, current_risk may not be \"good\" if:\n"
-        "     * The patch was later reverted or removed\n"
-        "     * Subsequent changes re-introduced the vulnerability\n"
-        "     * The patched code was refactored in a way that broke the fix\n"
-        "   - If patch was inadequate, check 'current' state to see if the vulnerability still exists\n"
-        "   - Rate: \"good\" (no risk) | \"low\" | \"medium\" | \"high\" (risk persists)\n\n"
-        "3) **Proof of Concept**: Required ONLY if current_risk is not \"good\".\n"
-        "   - Provide exploit code or detailed steps demonstrating the vulnerability in the 'current' state\n"
-        "   - Omit this field if current_risk is \"good\"\n\n"
-        "Respond in JSON only with fields: {\n"
-        "  \"patch_risk\": \"good\" | \"low\" | \"medium\" | \"high\",\n"
-        "  \"current_risk\": \"good\" | \"low\" | \"medium\" | \"high\",\n"
-        "  \"reason\": string,\n"
-        "  \"poc\"?: string  // Required only if current_risk != \"good\"\n"
-        "}\n"
     )
-    if diff_text:
-        body += "\n\n--- DIFF (unified) ---\n" + diff_text
-    return body
-
+    body = _STATE_BODIES[bool(has_previous), bool(has_current)]
+    batch_hint = (
+        f"When you need several reads at once, send them in a single '{batch_tool}' call.\n"
+        if batch_tool
+        else ""
+    )
+    if not diff_text:
+        return "".join((header, body, batch_hint, _TASK_BODY))
+    return "".join((header, body, batch_hint, _TASK_BODY, "\n\n--- DIFF (unified) ---\n", diff_text))
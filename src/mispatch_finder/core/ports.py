@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import secrets
 from pathlib import Path
-from typing import Protocol, Union, overload, Iterator, Any, Optional
-from dataclasses import dataclass
+from typing import Callable, Collection, Protocol, overload, Iterator, Any
+from dataclasses import dataclass, field
 
 from .domain.models import Vulnerability
 
@@ -34,7 +33,7 @@ class VulnerabilityDataPort(Protocol):
         limit: int,
         ecosystem: str = "npm",
         detailed: bool = False,
-        filter_expr: Optional[str] = None,
+        filter_expr: str | None = None,
     ) -> list[str]: ...
 
     @overload
@@ -43,7 +42,7 @@ class VulnerabilityDataPort(Protocol):
         limit: int,
         ecosystem: str = "npm",
         detailed: bool = True,
-        filter_expr: Optional[str] = None,
+        filter_expr: str | None = None,
     ) -> list[Vulnerability]: ...
 
     def list_vulnerabilities(
@@ -51,8 +50,8 @@ class VulnerabilityDataPort(Protocol):
         limit: int,
         ecosystem: str = "npm",
         detailed: bool = False,
-        filter_expr: Optional[str] = None,
-    ) -> Union[list[str], list[Vulnerability]]:
+        filter_expr: str | None = None,
+    ) -> list[str] | list[Vulnerability]:
         """List vulnerabilities with optional detailed metadata.
 
         Args:
@@ -74,7 +73,8 @@ class VulnerabilityDataPort(Protocol):
         self,
         ecosystem: str = "npm",
         detailed: bool = False,
-        filter_expr: Optional[str] = None,
+        filter_expr: str | None = None,
+        exclude_ids: Collection[str] = (),
     ) -> Iterator[str] | Iterator[Vulnerability]:
         """Iterate over vulnerabilities lazily.
 
@@ -85,6 +85,7 @@ class VulnerabilityDataPort(Protocol):
                         Available variables: ghsa_id, cve_id, has_cve, severity, summary, description,
                         published_at, modified_at, ecosystem, repo_slug, stars, size_bytes,
                         repo_count, commit_count, poc_count
+            exclude_ids: GHSA IDs to skip before any conversion (pass a set for O(1) lookups)
 
         Yields:
             str if detailed=False (GHSA IDs)
@@ -92,7 +93,7 @@ class VulnerabilityDataPort(Protocol):
         """
         ...
 
-    def clear_cache(self, prefix: Optional[str] = None) -> None:
+    def clear_cache(self, prefix: str | None = None) -> None:
         """Clear cached vulnerability data.
 
         Args:
@@ -110,7 +111,7 @@ class RepositoryPort(Protocol):
         repo_url: str,
         commit: str,
         force_reclone: bool,
-    ) -> tuple[Optional[Path], Optional[Path]]:
+    ) -> tuple[Path | None, Path | None]:
         """Prepare and return (current_workdir, previous_workdir)."""
         ...
 
@@ -119,7 +120,11 @@ class RepositoryPort(Protocol):
         ...
 
 
-@dataclass
+def _no_cleanup() -> None:
+    pass
+
+
+@dataclass(slots=True)
 class MCPServerContext:
     """MCP server runtime context."""
     transport: str  # "stdio" or "streamable-http"
@@ -127,10 +132,10 @@ class MCPServerContext:
     public_url: str | None  # Only for streamable-http with tunnel
     has_current: bool
     has_previous: bool
-
-    def cleanup(self) -> None:
-        """Cleanup hook called by context manager."""
-        pass
+    # Tool that runs several tool calls in one request, if the server exposes one
+    batch_tool: str | None = None
+    # Cleanup hook called by the orchestrator; adapters set it per instance
+    cleanup: Callable[[], None] = field(default=_no_cleanup, repr=False, compare=False)
 
 
 class MCPServerPort(Protocol):
@@ -139,8 +144,8 @@ class MCPServerPort(Protocol):
     def start_servers(
         self,
         *,
-        current_workdir: Optional[Path],
-        previous_workdir: Optional[Path],
+        current_workdir: Path | None,
+        previous_workdir: Path | None,
         auth_token: str,
         transport: str,  # "stdio" or "streamable-http"
         port: int | None = None,  # Required for streamable-http, ignored for stdio
@@ -232,7 +237,18 @@ class LoggerPort(Protocol):
     def exception(self, message: str, **kwargs: Any) -> None:
         ...
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Whether a record at ``level`` (e.g. "INFO") would be emitted.
+
+        Lets callers skip building large payloads that would be discarded.
+        """
+        ...
+
 
 class DefaultTokenGenerator:
     def generate(self) -> str:
+        # Imported on first use: secrets pulls in hmac/hashlib, which every
+        # CLI command would otherwise pay for at import time
+        import secrets
+
         return secrets.token_urlsafe(32)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Final
 
 from ..domain.models import AnalysisResult, Vulnerability
 from ..domain.prompt import build_prompt
@@ -15,6 +16,39 @@ from ..ports import (
 from .diff_service import DiffService
 from .json_extractor import JsonExtractor
 
+# Result field -> candidate response keys, first string value wins.
+# current_risk/patch_risk are the new names; the rest are legacy fallbacks.
+_STR_FIELDS: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    ("verdict", ("current_risk",)),
+    ("severity", ("patch_risk",)),
+    ("rationale", ("reason", "rationale")),
+    ("poc_idea", ("poc", "poc_idea")),
+)
+_RESULT_FIELDS: Final[tuple[str, ...]] = (*(name for name, _ in _STR_FIELDS), "evidence")
+
+
+def _parse_result_fields(parsed: dict[str, Any] | None) -> dict[str, Any]:
+    """Map the parsed LLM JSON response onto AnalysisResult fields.
+
+    Fields that are missing, mistyped, or unparseable stay None.
+    """
+    fields: dict[str, Any] = dict.fromkeys(_RESULT_FIELDS)
+    if parsed is None:
+        return fields
+
+    for field_name, keys in _STR_FIELDS:
+        for key in keys:
+            value = parsed.get(key)
+            if isinstance(value, str):
+                fields[field_name] = value
+                break
+
+    # Evidence: handle both list and dict formats
+    ev = parsed.get("evidence")
+    if isinstance(ev, (list, dict)):
+        fields["evidence"] = ev if isinstance(ev, list) else [ev]
+    return fields
+
 
 class AnalysisOrchestrator:
     """Orchestrates the complete analysis workflow.
@@ -35,6 +69,7 @@ class AnalysisOrchestrator:
         diff_service: DiffService,
         json_extractor: JsonExtractor,
         mcp_port: int,
+        public_url: str | None = None,
     ) -> None:
         self._vuln_data = vuln_data
         self._repo = repo
@@ -45,6 +80,8 @@ class AnalysisOrchestrator:
         self._diff_service = diff_service
         self._json_extractor = json_extractor
         self._mcp_port = mcp_port
+        # Externally managed tunnel (e.g. shared across a batch) replaces the per-run one
+        self._public_url = public_url
 
     def analyze(self, *, ghsa: str, force_reclone: bool = False) -> AnalysisResult:
         """Execute complete analysis workflow for a GHSA.
@@ -56,7 +93,6 @@ class AnalysisOrchestrator:
         Returns:
             Analysis result
         """
-        mcp_token = self._token_gen.generate()
         mcp_ctx = None
 
         try:
@@ -89,12 +125,28 @@ class AnalysisOrchestrator:
                 },
             )
 
-            # 3) Generate diff
+            # 3) Generate diff while 4) MCP servers + tunnel start (independent I/O)
             base_worktree = current or previous
-            diff_result = self._diff_service.generate_diff(
-                workdir=base_worktree,
-                commit=vuln.commit_hash,
-            )
+            # Token is minted only once MCP is about to start (not for runs that
+            # fail during metadata fetch or repo preparation)
+            mcp_token = self._token_gen.generate()
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                diff_future = pool.submit(
+                    self._diff_service.generate_diff,
+                    workdir=base_worktree,
+                    commit=vuln.commit_hash,
+                )
+                mcp_ctx = self._mcp.start_servers(
+                    current_workdir=current,
+                    previous_workdir=previous,
+                    auth_token=mcp_token,
+                    transport="streamable-http",
+                    port=self._mcp_port,
+                    # Analysis always requires a public URL for LLM access
+                    use_tunnel=self._public_url is None,
+                )
+                diff_result = diff_future.result()
+
             self._logger.info(
                 "diff_built",
                 type="diff_built",
@@ -102,28 +154,19 @@ class AnalysisOrchestrator:
                 included_len=diff_result.included_len,
                 truncated=diff_result.was_truncated,
             )
-
-            # 4) Start MCP servers + tunnel
-            mcp_ctx = self._mcp.start_servers(
-                current_workdir=current,
-                previous_workdir=previous,
-                auth_token=mcp_token,
-                transport="streamable-http",
-                port=self._mcp_port,
-                use_tunnel=True,  # Analysis always requires tunnel for LLM access
-            )
+            public_url = self._public_url or mcp_ctx.public_url
             self._logger.info(
                 "mcp_ready",
                 type="mcp_ready",
                 local_url=mcp_ctx.local_url,
-                public_url=mcp_ctx.public_url,
+                public_url=public_url,
                 has_current=mcp_ctx.has_current,
                 has_previous=mcp_ctx.has_previous,
             )
 
             # Verify tunnel was established (required for LLM access)
-            if mcp_ctx.public_url is None:
-                raise RuntimeError("MCP tunnel failed to start - public_url is None")
+            if public_url is None:
+                raise RuntimeError("No public MCP URL - tunnel failed to start and none was configured")
 
             # 5) Build prompt and call LLM
             prompt = build_prompt(
@@ -133,92 +176,40 @@ class AnalysisOrchestrator:
                 has_previous=mcp_ctx.has_previous,
                 has_current=mcp_ctx.has_current,
                 diff_text=diff_result.truncated_text,
+                batch_tool=mcp_ctx.batch_tool,
             )
+            # The prompt now holds the only copy still needed; let the untruncated
+            # diff be freed before the (minutes-long) LLM call
+            del diff_result, diff_future
 
             raw_text = self._llm.call(
                 prompt=prompt,
-                mcp_url=mcp_ctx.public_url + '/mcp',
+                mcp_url=public_url + '/mcp',
                 mcp_token=mcp_token,
             )
 
-            # 6) Extract JSON from LLM response
-            extracted_json = self._json_extractor.extract(raw_text)
-
-            # 7) Parse extracted JSON and populate result fields
-            verdict = None
-            severity = None
-            rationale = None
-            evidence = None
-            poc_idea = None
-
-            try:
-                parsed = json.loads(extracted_json)
-                if isinstance(parsed, dict):
-                    # Map new field names (current_risk, patch_risk) to verdict/severity
-                    current_risk = parsed.get("current_risk")
-                    patch_risk = parsed.get("patch_risk")
-
-                    # Verdict: use current_risk if available
-                    if isinstance(current_risk, str):
-                        verdict = current_risk
-
-                    # Severity: use patch_risk if available
-                    if isinstance(patch_risk, str):
-                        severity = patch_risk
-
-                    # Rationale: prefer 'reason', fallback to 'rationale'
-                    reason = parsed.get("reason")
-                    if isinstance(reason, str):
-                        rationale = reason
-                    elif isinstance(parsed.get("rationale"), str):
-                        rationale = parsed.get("rationale")
-
-                    # Evidence: handle both list and dict formats
-                    ev = parsed.get("evidence")
-                    if isinstance(ev, list):
-                        evidence = ev
-                    elif isinstance(ev, dict):
-                        evidence = [ev]
-
-                    # PoC: prefer 'poc', fallback to 'poc_idea'
-                    poc = parsed.get("poc")
-                    if isinstance(poc, str):
-                        poc_idea = poc
-                    elif isinstance(parsed.get("poc_idea"), str):
-                        poc_idea = parsed.get("poc_idea")
-            except json.JSONDecodeError:
-                # If parsing fails, leave all fields as None
-                pass
+            # 6) Extract JSON from LLM response (parsed once, reused for the fields)
+            extracted_json, parsed = self._json_extractor.extract_object(raw_text)
+
+            # 7) Populate result fields from the parsed object
+            fields = _parse_result_fields(parsed)
 
             # 8) Build result
             result = AnalysisResult(
                 ghsa=ghsa,
                 provider="",  # Will be filled from logs
                 model="",  # Will be filled from logs
-                verdict=verdict,
-                severity=severity,
-                rationale=rationale,
-                evidence=evidence,
-                poc_idea=poc_idea,
                 raw_text=extracted_json,
+                **fields,
             )
 
             # Log with dict representation for JSON serialization
-            self._logger.info(
-                "final_result",
-                type="final_result",
-                result={
-                    "ghsa": result.ghsa,
-                    "provider": result.provider,
-                    "model": result.model,
-                    "verdict": result.verdict,
-                    "severity": result.severity,
-                    "rationale": result.rationale,
-                    "evidence": result.evidence,
-                    "poc_idea": result.poc_idea,
-                    "raw_text": result.raw_text,
-                },
-            )
+            if self._logger.is_enabled_for("INFO"):
+                self._logger.info(
+                    "final_result",
+                    type="final_result",
+                    result=result.to_dict(),
+                )
 
             return result
 
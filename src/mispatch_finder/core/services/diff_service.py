@@ -5,8 +5,12 @@ from pathlib import Path
 
 from ..ports import RepositoryPort
 
+# Max distance a truncation cut may move to reach a line boundary; beyond
+# that (e.g. minified bundles) the raw char offset keeps the budget in use
+_LINE_SNAP_WINDOW = 2048
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DiffResult:
     """Result of diff generation with metadata."""
     full_text: str
@@ -16,6 +20,10 @@ class DiffResult:
     was_truncated: bool
 
 
+# Shared result for runs without a workdir (immutable, so safe to reuse)
+_EMPTY_DIFF = DiffResult(full_text="", truncated_text="", full_len=0, included_len=0, was_truncated=False)
+
+
 class DiffService:
     """Domain service for generating and processing diffs.
 
@@ -25,6 +33,7 @@ class DiffService:
     def __init__(self, *, repo: RepositoryPort, max_chars: int) -> None:
         self._repo = repo
         self._max_chars = max_chars
+        self._half = max_chars // 2
 
     def generate_diff(
         self,
@@ -41,26 +50,52 @@ class DiffService:
         Returns:
             DiffResult with full and truncated diff text
         """
-        # Get full diff
         if workdir is None:
-            full_text = ""
-        else:
-            full_text = self._repo.get_diff(workdir=workdir, commit=commit)
-
-        # Truncate if needed (middle-truncation strategy)
-        truncated_text = full_text
-        was_truncated = False
-
-        if len(full_text) > self._max_chars:
-            was_truncated = True
-            head = full_text[: self._max_chars // 2]
-            tail = full_text[-(self._max_chars - len(head)) :]
-            truncated_text = head + "\n...\n" + tail
-
+            return _EMPTY_DIFF
+        full_text = self._repo.get_diff(workdir=workdir, commit=commit)
+        full_len = len(full_text)
+        truncated_text = self._truncate(full_text)
         return DiffResult(
             full_text=full_text,
             truncated_text=truncated_text,
-            full_len=len(full_text),
+            full_len=full_len,
             included_len=len(truncated_text),
-            was_truncated=was_truncated,
+            was_truncated=truncated_text is not full_text,
         )
+
+    def generate_text(
+        self,
+        *,
+        workdir: Path | None,
+        commit: str,
+    ) -> str:
+        """Generate only the (possibly truncated) diff text.
+
+        For callers that don't need the metadata; skips building a DiffResult.
+
+        Args:
+            workdir: Working directory containing the repository
+            commit: Commit hash to generate diff for
+
+        Returns:
+            Diff text, middle-truncated if over the budget
+        """
+        if workdir is None:
+            return ""
+        return self._truncate(self._repo.get_diff(workdir=workdir, commit=commit))
+
+    def _truncate(self, full_text: str) -> str:
+        """Middle-truncate ``full_text`` to the budget; returns it unchanged if within it."""
+        full_len = len(full_text)
+        if full_len <= self._max_chars:
+            return full_text
+        # Align cuts to line boundaries so no hunk line is split mid-token;
+        # fall back to raw char offsets when no newline is within the window
+        half = self._half
+        head_end = full_text.rfind("\n", max(0, half - _LINE_SNAP_WINDOW), half) + 1 or half
+        tail_start = full_len - (self._max_chars - head_end)
+        tail_nl = full_text.find("\n", tail_start, tail_start + _LINE_SNAP_WINDOW)
+        if tail_nl != -1:
+            tail_start = tail_nl + 1
+        # Single join: avoids the intermediate (head + marker) temporary
+        return "".join((full_text[:head_end], "\n...\n", full_text[tail_start:]))
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+from typing import Any, Final
+
+_FENCE: Final[str] = "```json"
 
 
 class JsonExtractor:
@@ -21,19 +24,54 @@ class JsonExtractor:
         Raises:
             ValueError: If no valid JSON found
         """
-        # Find JSON boundaries
-        start = text.find('{')
-        end = text.rfind('}')
+        return self.extract_object(text)[0]
+
+    def extract_object(self, text: str) -> tuple[str, dict[str, Any] | None]:
+        """Extract JSON block from text, also returning the parsed object.
+
+        Lets callers that need the fields reuse this parse instead of
+        running json.loads again on the formatted string.
+
+        Args:
+            text: Raw text potentially containing JSON
+
+        Returns:
+            (formatted JSON string, parsed object); when no valid JSON object
+            is found, (original text, None)
+        """
+        # Bare JSON answer: parse it directly, no fence scan over the whole text
+        stripped = text.strip()
+        if stripped[:1] == "{" and stripped[-1:] == "}":
+            bare = self._parse(stripped, 0, len(stripped))
+            if bare is not None:
+                return json.dumps(bare, ensure_ascii=False), bare
+
+        # Fast path: a ```json fence bounds the search, so braces in surrounding prose can't widen it
+        fence = text.find(_FENCE)
+        if fence != -1:
+            body_start = fence + len(_FENCE)
+            body_end = text.find("```", body_start)
+            fenced = self._parse(text, body_start, len(text) if body_end == -1 else body_end)
+            if fenced is not None:
+                return json.dumps(fenced, ensure_ascii=False), fenced
+
+        # Otherwise use the outermost braces of the whole text; return as-is if that fails
+        extracted = self._parse(text, 0, len(text))
+        if extracted is None:
+            return text, None
+        return json.dumps(extracted, ensure_ascii=False), extracted
+
+    @staticmethod
+    def _parse(text: str, lo: int, hi: int) -> dict[str, Any] | None:
+        """Parse the outermost {...} within text[lo:hi], or None."""
+        start = text.find('{', lo, hi)
+        end = text.rfind('}', lo, hi)
 
         if start == -1 or end == -1 or end <= start:
-            # No JSON found, return as-is
-            return text
+            # No JSON found
+            return None
 
-        # Extract and reformat JSON
         try:
-            json_str = text[start:end + 1]
-            parsed = json.loads(json_str)
-            return json.dumps(parsed, ensure_ascii=False)
+            return json.loads(text[start:end + 1])
         except json.JSONDecodeError:
-            # If parsing fails, return original text
-            return text
+            return None
@@ -10,6 +10,8 @@ class AnalyzeUseCase:
     Thin orchestration layer that delegates to AnalysisOrchestrator.
     """
 
+    __slots__ = ("_orchestrator",)
+
     def __init__(
         self,
         *,
@@ -4,6 +4,8 @@ from ..ports import CachePort, VulnerabilityDataPort
 
 
 class ClearCacheUseCase:
+    __slots__ = ("_cache", "_vuln_data")
+
     def __init__(
         self,
         *,
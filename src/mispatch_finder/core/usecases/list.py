@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import islice
 from typing import cast
 
 from ..domain.models import Vulnerability
@@ -13,9 +14,18 @@ class ListUseCase:
     Business logic: Fetch vulnerabilities, filter out analyzed ones, apply limit.
     """
 
-    def __init__(self, *, vuln_data: VulnerabilityDataPort, analysis_store: AnalysisStorePort) -> None:
+    __slots__ = ("_vuln_data", "_analysis_store", "_default_limit")
+
+    def __init__(
+        self,
+        *,
+        vuln_data: VulnerabilityDataPort,
+        analysis_store: AnalysisStorePort,
+        default_limit: int = 10,
+    ) -> None:
         self._vuln_data = vuln_data
         self._analysis_store = analysis_store
+        self._default_limit = default_limit
 
     def execute(
         self,
@@ -29,7 +39,7 @@ class ListUseCase:
         """Execute the use case.
 
         Args:
-            limit: Maximum number of items to return (after filtering). Defaults to 10 if None.
+            limit: Maximum number of items to return (after filtering). Defaults to default_limit if None.
             ecosystem: Ecosystem filter (e.g., "npm", "pypi")
             detailed: If True, return full Vulnerability objects; if False, return GHSA IDs only
             filter_expr: Optional filter expression (e.g., "stars > 1000")
@@ -39,45 +49,20 @@ class ListUseCase:
             list[str]: GHSA IDs when detailed=False
             list[Vulnerability]: Vulnerability objects when detailed=True
         """
-        # Default limit
+        # Default limit (injected from config)
         if limit is None:
-            limit = 10
-
-        # If include_analyzed=True, collect without filtering
-        if include_analyzed:
-            result: list[str] | list[Vulnerability] = []
-            for item in self._vuln_data.list_vulnerabilities_iter(
-                ecosystem=ecosystem,
-                detailed=detailed,
-                filter_expr=filter_expr,
-            ):
-                result.append(cast(Vulnerability, item))
-                if len(result) >= limit:
-                    break
-            return result
+            limit = self._default_limit
 
-        # Filter out analyzed items using lazy iteration
-        analyzed_ids = self._analysis_store.get_analyzed_ids()
-        result_filtered: list[str] | list[Vulnerability] = []
+        # Fetched once and pushed into the port, which skips analyzed IDs
+        # before converting them to domain models
+        analyzed_ids = set() if include_analyzed else self._analysis_store.get_analyzed_ids()
 
-        for item in self._vuln_data.list_vulnerabilities_iter(
+        items = self._vuln_data.list_vulnerabilities_iter(
             ecosystem=ecosystem,
             detailed=detailed,
             filter_expr=filter_expr,
-        ):
-            # Extract GHSA ID for checking
-            if detailed:
-                ghsa_id = cast(str, cast(Vulnerability, item).ghsa_id)
-            else:
-                ghsa_id = cast(str, item)
-
-            # Skip if already analyzed
-            if ghsa_id in analyzed_ids:
-                continue
-
-            result_filtered.append(cast(Vulnerability, item))
-            if len(result_filtered) >= limit:
-                break
-
-        return result_filtered
-
+            exclude_ids=analyzed_ids,
+        )
+        # islice stops pulling from the lazy iterator at the limit; list() then
+        # builds the result in C without a per-item length check
+        return cast(list[Vulnerability], list(islice(items, max(limit, 1))))
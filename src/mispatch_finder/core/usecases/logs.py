@@ -4,6 +4,8 @@ from ..ports import AnalysisStorePort
 
 
 class LogsUseCase:
+    __slots__ = ("_analysis_store",)
+
     def __init__(self, *, analysis_store: AnalysisStorePort) -> None:
         self._analysis_store = analysis_store
 
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import Final
+
 from ..ports import MCPServerPort, VulnerabilityDataPort, RepositoryPort, TokenGeneratorPort
 
+# Placeholder token handed to the MCP server when authentication is disabled
+_NO_AUTH_TOKEN: Final = "no-auth-required"
+
 
 class MCPUseCase:
     """Use case for starting standalone MCP server.
@@ -11,6 +16,8 @@ class MCPUseCase:
     Prepares repository workdirs from GHSA ID.
     """
 
+    __slots__ = ("_mcp_server", "_vuln_data", "_repo", "_token_gen")
+
     def __init__(
         self,
         *,
@@ -71,7 +78,7 @@ class MCPUseCase:
         )
 
         # Generate authentication token if requested
-        auth_token = self._token_gen.generate() if use_auth else "no-auth-required"
+        auth_token = self._token_gen.generate() if use_auth else _NO_AUTH_TOKEN
 
         # Start MCP server
         ctx = self._mcp_server.start_servers(
@@ -11,16 +11,21 @@ class PromptUseCase:
     Shows the raw prompt that would be sent to the LLM for a given GHSA.
     """
 
+    __slots__ = ("_vuln_data", "_repo", "_diff_service", "_batch_tool")
+
     def __init__(
         self,
         *,
         vuln_data: VulnerabilityDataPort,
         repo: RepositoryPort,
         diff_service: DiffService,
+        batch_tool: str | None = None,
     ) -> None:
         self._vuln_data = vuln_data
         self._repo = repo
         self._diff_service = diff_service
+        # Batch tool the analysis MCP server exposes, so the preview matches the real prompt
+        self._batch_tool = batch_tool
 
     def execute(self, *, ghsa: str, force_reclone: bool = False) -> str:
         """Generate and return the analysis prompt.
@@ -34,27 +39,30 @@ class PromptUseCase:
         """
         # 1) Fetch GHSA metadata
         vuln = self._vuln_data.fetch_metadata(ghsa)
+        repo_url = vuln.repository.url
+        commit = vuln.commit_hash
 
         # 2) Prepare repositories to check availability
         current, previous = self._repo.prepare_workdirs(
-            repo_url=vuln.repository.url,
-            commit=vuln.commit_hash,
+            repo_url=repo_url,
+            commit=commit,
             force_reclone=force_reclone,
         )
 
-        # 3) Generate diff
+        # 3) Generate diff (text only; the prompt needs no diff metadata)
         base_worktree = current or previous
-        diff_result = self._diff_service.generate_diff(
+        diff_text = self._diff_service.generate_text(
             workdir=base_worktree,
-            commit=vuln.commit_hash,
+            commit=commit,
         )
 
         # 4) Build and return prompt
         return build_prompt(
             ghsa=ghsa,
-            repo_url=vuln.repository.url,
-            commit=vuln.commit_hash,
+            repo_url=repo_url,
+            commit=commit,
             has_previous=previous is not None,
             has_current=current is not None,
-            diff_text=diff_result.truncated_text,
+            diff_text=diff_text,
+            batch_tool=self._batch_tool,
         )
@@ -6,6 +6,7 @@ from ..core.ports import AnalysisStorePort
 from .logging.log_summary import (
     format_single_summary,
     format_summary_table,
+    list_done_ids,
     parse_log_details,
     summarize_logs,
 )
@@ -44,7 +45,10 @@ class AnalysisStore:
             raise FileNotFoundError(f"Log file not found: {log_fp}")
 
         if verbose:
-            return log_fp.read_text(encoding="utf-8").splitlines()
+            # Stream lines instead of holding the whole file as one str next to
+            # its split copy; JSONL records never contain raw newlines
+            with log_fp.open(encoding="utf-8") as f:
+                return [line.rstrip("\n") for line in f]
 
         details = parse_log_details(log_fp)
         return format_single_summary(details)
@@ -67,5 +71,4 @@ class AnalysisStore:
         Returns:
             Set of GHSA identifiers that have completed analysis
         """
-        summaries = summarize_logs(self._analysis_dir, verbose=False)
-        return {ghsa_id for ghsa_id, summary in summaries.items() if summary.done}
+        return list_done_ids(self._analysis_dir)
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from .llm_adapters import Toolset, get_adapter
+import hashlib
+
+from .llm_adapters import LLMHostedMCPAdapter, Toolset, get_adapter
 from ..core.ports import LLMPort, LoggerPort
 
+# Upper bound on prompt/raw_text embedded in a single log record
+_LOG_PAYLOAD_MAX_CHARS = 8192
+
+
+def _clip(text: str, limit: int = _LOG_PAYLOAD_MAX_CHARS) -> str:
+    """Clip text for logging, noting how many characters were dropped."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<+{len(text) - limit}>"
+
 
 class LLM:
     def __init__(self, *, provider: str, model: str, api_key: str, logger: LoggerPort) -> None:
@@ -10,6 +22,13 @@ class LLM:
         self._model = model
         self._api_key = api_key
         self._logger = logger
+        # Built on first call and reused, so the SDK's pooled HTTP client keeps its connections
+        self._adapter: LLMHostedMCPAdapter | None = None
+
+    def _get_adapter(self) -> LLMHostedMCPAdapter:
+        if self._adapter is None:
+            self._adapter = get_adapter(self._provider, self._model, self._api_key)
+        return self._adapter
 
     def call(
         self,
@@ -18,17 +37,20 @@ class LLM:
         mcp_url: str,
         mcp_token: str,
     ) -> str:
-        # Log LLM input with provider/model info
-        self._logger.info(
-            "llm_input",
-            type="llm_input",
-            provider=self._provider,
-            model=self._model,
-            prompt_len=len(prompt),
-            prompt=prompt,
-        )
+        # Log LLM input with provider/model info (skip building the payload if INFO is off)
+        if self._logger.is_enabled_for("INFO"):
+            self._logger.info(
+                "llm_input",
+                type="llm_input",
+                provider=self._provider,
+                model=self._model,
+                prompt_len=len(prompt),
+                # Identifies the full prompt even though the logged copy is clipped
+                prompt_sha1=hashlib.sha1(prompt.encode("utf-8", "ignore")).hexdigest()[:12],
+                prompt=_clip(prompt),
+            )
 
-        adapter = get_adapter(self._provider, self._model, self._api_key)
+        adapter = self._get_adapter()
         toolset = [
             Toolset(
                 label="mispatch_tools",
@@ -53,13 +75,14 @@ class LLM:
             )
 
         # Log LLM output
-        self._logger.info(
-            "llm_output",
-            type="llm_output",
-            provider=self._provider,
-            model=self._model,
-            raw_text_len=len(text),
-            raw_text=text,
-        )
+        if self._logger.is_enabled_for("INFO"):
+            self._logger.info(
+                "llm_output",
+                type="llm_output",
+                provider=self._provider,
+                model=self._model,
+                raw_text_len=len(text),
+                raw_text=_clip(text),
+            )
 
         return text
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 Provider = Literal["openai", "anthropic"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Toolset:
     """Declarative configuration for one remote MCP server.
 
@@ -28,14 +28,14 @@ class Toolset:
     require_approval: "McpRequireApproval" | None = "never"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     input_tokens: int | None = None
     output_tokens: int | None = None
     total_tokens: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     text: str
     usage: TokenUsage | None = None
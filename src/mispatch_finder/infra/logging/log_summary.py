@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSummary:
     ghsa_id: str
     current_risk: str = ""
@@ -20,7 +21,7 @@ class RunSummary:
     done: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LogDetails:
     ghsa_id: str
     repo_url: str = ""
@@ -185,10 +186,10 @@ def parse_log_file(fp: Path, verbose: bool = False) -> RunSummary:
             payload = {}
 
         if msg == "mcp_request":
-            # exclude inventory listing calls
-            if payload.get("method") == "tools/list":
-                pass
-            else:
+            # Count tool calls only: session setup (initialize/discover,
+            # notifications) and tools/list - also sent by the nested in-memory
+            # session each batch_execute opens - are not tool usage
+            if payload.get("method") == "tools/call":
                 mcp_total_calls += 1
                 if verbose:
                     # Support both old 'message' and new 'mcp_message' field names
@@ -291,11 +292,22 @@ def parse_log_file(fp: Path, verbose: bool = False) -> RunSummary:
     )
 
 
-def summarize_logs(logs_dir: Path, verbose: bool = False) -> dict[str, RunSummary]:
+def _log_files(logs_dir: Path) -> list[Path]:
+    # os.scandir yields DirEntry objects whose is_file() reuses the directory
+    # listing's d_type, avoiding a stat per file (unlike Path.glob + is_file)
     try:
-        files = sorted([p for p in logs_dir.glob("*.jsonl") if p.is_file()])
+        with os.scandir(logs_dir) as it:
+            return sorted(
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(".jsonl") and entry.is_file()
+            )
     except FileNotFoundError:
-        files = []
+        return []
+
+
+def summarize_logs(logs_dir: Path, verbose: bool = False) -> dict[str, RunSummary]:
+    files = _log_files(logs_dir)
 
     # Parse, then sort by run_date descending (empty dates last)
     items: list[RunSummary] = []
@@ -310,6 +322,38 @@ def summarize_logs(logs_dir: Path, verbose: bool = False) -> dict[str, RunSummar
     return summaries
 
 
+_FINAL_RESULT_MARKER = b'"final_result"'
+
+
+def _has_final_result(fp: Path) -> bool:
+    """Whether the log has a final_result record (same rule as RunSummary.done)."""
+    data = fp.read_bytes()
+    # Most of a log is MCP wiretap payload; only lines naming final_result can match
+    if _FINAL_RESULT_MARKER not in data:
+        return False
+    for line in data.splitlines():
+        if _FINAL_RESULT_MARKER not in line:
+            continue
+        try:
+            obj = json.loads(line)
+        except Exception:
+            continue
+        payload = obj.get("payload")
+        if payload is None:
+            payload = obj
+        if isinstance(payload, dict) and payload.get("type") == "final_result":
+            return True
+    return False
+
+
+def list_done_ids(logs_dir: Path) -> set[str]:
+    """Return GHSA IDs whose log recorded a final result.
+
+    Equivalent to filtering summarize_logs() on done, without parsing every line.
+    """
+    return {fp.stem for fp in _log_files(logs_dir) if _has_final_result(fp)}
+
+
 def format_summary_table(summaries: dict[str, RunSummary], verbose: bool = False) -> list[str]:
     if not summaries:
         return ["No logs found."]
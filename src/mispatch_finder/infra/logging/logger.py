@@ -101,6 +101,18 @@ class AnalysisLogger(Resource):
         else:
             self._logger.error(message, exc_info=exc_info)
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Return True if a record at ``level`` would be emitted.
+
+        Raises:
+            ValueError: If ``level`` is not a known logging level name
+        """
+        try:
+            levelno = logging.getLevelNamesMapping()[level.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown log level: {level!r}") from None
+        return self._logger.isEnabledFor(levelno)
+
     def exception(self, message: str, **kwargs) -> None:
         """Log exception with traceback and optional extra fields."""
         if kwargs:
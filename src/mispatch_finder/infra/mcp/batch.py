@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Final, TypedDict
+
+from fastmcp import Client, FastMCP
+from mcp.types import CallToolResult
+
+BATCH_TOOL_NAME: Final[str] = "batch_execute"
+_MAX_CONCURRENT: Final[int] = 8
+_OP_TIMEOUT_S: Final[float] = 30.0
+
+
+class BatchOp(TypedDict):
+    tool: str
+    args: dict[str, Any]
+
+
+def _result_payload(result: CallToolResult) -> Any:
+    """Prefer structured content; fall back to the joined text blocks."""
+    if result.structuredContent is not None:
+        return result.structuredContent
+    return "".join(getattr(block, "text", "") for block in result.content)
+
+
+def register_batch_execute(
+    app: FastMCP,
+    *,
+    max_concurrent: int = _MAX_CONCURRENT,
+    op_timeout_s: float = _OP_TIMEOUT_S,
+) -> None:
+    """Expose a tool that runs several tool calls of ``app`` in one request.
+
+    The saving is in LLM round-trips, not execution time. All ops of one
+    batch share a single in-memory client session to ``app`` (so middleware
+    still logs each call). They are dispatched concurrently, at most
+    ``max_concurrent`` at a time, but synchronous tools (repo_read_mcp's
+    are) run on the event loop, so in practice they execute one after
+    another. For the same reason ``op_timeout_s`` only bounds async tools
+    and cannot interrupt a blocked sync one. Failures and timeouts are
+    reported per op instead of failing the whole batch.
+    """
+
+    async def batch_execute(ops: list[BatchOp]) -> list[dict[str, Any]]:
+        """Run multiple read-only repository tool calls in one request.
+
+        Args:
+            ops: Tool calls as {"tool": <tool name>, "args": {...}}
+
+        Returns:
+            One entry per op, in order: {"tool", "ok", "result"} or {"tool", "ok", "error"}
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run_one(client: Client, op: BatchOp) -> dict[str, Any]:
+            tool = op["tool"]
+            if tool == BATCH_TOOL_NAME:
+                return {"tool": tool, "ok": False, "error": "batch_execute cannot be nested"}
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(
+                        client.call_tool_mcp(tool, op.get("args") or {}),
+                        timeout=op_timeout_s,
+                    )
+                except TimeoutError:
+                    return {"tool": tool, "ok": False, "error": f"timed out after {op_timeout_s}s"}
+                except Exception as e:
+                    return {"tool": tool, "ok": False, "error": str(e)}
+            if result.isError:
+                return {"tool": tool, "ok": False, "error": _result_payload(result)}
+            return {"tool": tool, "ok": True, "result": _result_payload(result)}
+
+        async with Client(app) as client:
+            return list(await asyncio.gather(*(run_one(client, op) for op in ops)))
+
+    app.tool(batch_execute, name=BATCH_TOOL_NAME)
@@ -10,6 +10,8 @@ import time
 
 logger = logging.getLogger(__name__)
 
+_PUBLIC_URL_RE = re.compile(r"https://[0-9a-f]+\.lhr\.life")
+
 class Tunnel:
     """Subprocess-backed tunnel using `ssh` to localhost.run.
 
@@ -97,7 +99,7 @@ class Tunnel:
                     "type": "ssh_line",
                     "line": line,
                 })
-                m = re.search(r"https://[0-9a-f]+\.lhr\.life", line)
+                m = _PUBLIC_URL_RE.search(line)
                 if m and not self.public_url:
                     self.public_url = m.group(0)
                     break
@@ -116,7 +118,6 @@ class Tunnel:
                 "type": "tunnel_ready",
                 "public_url": self.public_url,
             })
-            print("\npublic url obtained:", self.public_url)
             return self.public_url
 
         # Failed to obtain URL; clean up and error
@@ -130,6 +131,10 @@ class Tunnel:
     def start(self, host: str, port: int) -> str:
         return self._launch(host, port)
 
+    def is_alive(self) -> bool:
+        """Whether the ssh process backing the tunnel is still running."""
+        return self._proc is not None and self._proc.poll() is None
+
     def stop(self) -> None:
         self._stop_event.set()
         if self._proc is None:
@@ -9,6 +9,9 @@ logger = logging.getLogger(__name__)
 
 class WiretapLoggingMiddleware(Middleware):
     async def on_message(self, ctx: MiddlewareContext, call_next):
+        # to_jsonable walks the whole message; skip it when INFO would be dropped
+        if not logger.isEnabledFor(logging.INFO):
+            return await call_next(ctx)
         # log incoming request fully (avoid 'message' - it's reserved by logging)
         logger.info("mcp_request", extra={
             "type": "request",
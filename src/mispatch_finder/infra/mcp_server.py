@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-import re
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from fastmcp import FastMCP
@@ -12,6 +12,7 @@ from repo_read_mcp import make_mcp_server as make_repo_mcp
 
 from ..core.ports import MCPServerContext, MCPServerPort, LoggerPort
 from ..shared.list_tools import list_tools
+from .mcp.batch import BATCH_TOOL_NAME, register_batch_execute
 from .mcp.tunnel import Tunnel
 from .mcp.wiretap_logging import WiretapLoggingMiddleware
 
@@ -19,28 +20,25 @@ from .mcp.wiretap_logging import WiretapLoggingMiddleware
 debug_logger = logging.getLogger(__name__)
 
 
+def _stop_started_tunnel(future: Future[tuple[str, Tunnel]]) -> None:
+    """Stop a speculatively started tunnel that was never handed back to the caller."""
+    if future.exception() is None:
+        future.result()[1].stop_tunnel()
+
+
 class MCPServer:
     def __init__(self, *, logger: LoggerPort) -> None:
         self._logger = logger
 
-    def start_servers(
-        self,
+    @staticmethod
+    def _build_app(
         *,
         current_workdir: Path | None,
         previous_workdir: Path | None,
         auth_token: str,
         transport: str,
-        port: int | None = None,
-        use_tunnel: bool = False,
-    ) -> MCPServerContext:
-        # Validate transport mode
-        if transport not in ("stdio", "streamable-http"):
-            raise ValueError(f"Invalid transport mode: {transport}. Must be 'stdio' or 'streamable-http'.")
-
-        # For streamable-http, port is required
-        if transport == "streamable-http" and port is None:
-            raise ValueError("Port is required for streamable-http transport mode.")
-
+    ) -> tuple[FastMCP | None, FastMCP | None, FastMCP]:
+        """Create the child repo servers and the aggregator that mounts them."""
         # 1) Create child repo servers
         current_repo = None
         previous_repo = None
@@ -67,96 +65,143 @@ class MCPServer:
         if previous_repo:
             app.mount(prefix="previous_repo", server=previous_repo)
 
-        debug_logger.debug(f"Mounted tools: {list_tools(app)}")
-
-        # 3) Handle transport-specific setup
-        tunnel_handle = None
-        local_url = None
-        public_url = None
-
-        if transport == "stdio":
-            # For stdio, run in main thread (blocking)
-            self._logger.info(
-                "mcp_stdio_starting",
-                type="mcp_stdio_starting",
-                mounted={
-                    "current_repo": bool(current_repo),
-                    "previous_repo": bool(previous_repo),
-                },
-            )
+        # Lets the model collapse several tool round-trips into one request
+        register_batch_execute(app)
 
-            # Build context (no cleanup needed for stdio)
-            ctx = MCPServerContext(
-                transport="stdio",
-                local_url=None,
-                public_url=None,
-                has_current=bool(current_repo),
-                has_previous=bool(previous_repo),
-            )
+        # list_tools runs a full in-memory client session; only pay for it when DEBUG is on
+        if debug_logger.isEnabledFor(logging.DEBUG):
+            debug_logger.debug("Mounted tools: %s", list_tools(app))
+
+        return current_repo, previous_repo, app
+
+    def start_servers(
+        self,
+        *,
+        current_workdir: Path | None,
+        previous_workdir: Path | None,
+        auth_token: str,
+        transport: str,
+        port: int | None = None,
+        use_tunnel: bool = False,
+    ) -> MCPServerContext:
+        # Validate transport mode
+        if transport not in ("stdio", "streamable-http"):
+            raise ValueError(f"Invalid transport mode: {transport}. Must be 'stdio' or 'streamable-http'.")
+
+        # For streamable-http, port is required
+        if transport == "streamable-http" and port is None:
+            raise ValueError("Port is required for streamable-http transport mode.")
 
-            # Run will block - this is intentional for stdio mode
-            app.run(transport="stdio")
-
-            return ctx
-
-        else:  # streamable-http
-            # Start aggregator in daemon thread
-            def run_app() -> None:
-                app.run(transport="streamable-http", port=port)
-
-            thread = threading.Thread(target=run_app, daemon=True)
-            thread.start()
-            local_url = f"http://127.0.0.1:{port}"
-
-            self._logger.info(
-                "aggregator_started",
-                type="aggregator_started",
-                transport="streamable-http",
-                local_url=local_url,
-                mounted={
-                    "current_repo": bool(current_repo),
-                    "previous_repo": bool(previous_repo),
-                },
+        host = "127.0.0.1"
+        tunnel_future: Future[tuple[str, Tunnel]] | None = None
+        if transport == "streamable-http" and use_tunnel:
+            # ssh -R only connects to the local port per forwarded request, so the
+            # tunnel (network-bound, seconds) can come up while the servers are built
+            pool = ThreadPoolExecutor(max_workers=1)
+            tunnel_future = pool.submit(Tunnel.start_tunnel, host, port)
+            pool.shutdown(wait=False)
+
+        # Until the tunnel is handed back in the context, any failure (building
+        # the servers, starting the app thread, ...) must stop it once it is up
+        handed_off = False
+        try:
+            current_repo, previous_repo, app = self._build_app(
+                current_workdir=current_workdir,
+                previous_workdir=previous_workdir,
+                auth_token=auth_token,
+                transport=transport,
             )
 
-            # 4) Start tunnel (optional for streamable-http)
-            if use_tunnel:
-                m = re.match(r"^https?://([^/:]+):(\d+)$", local_url)
-                if not m:
-                    raise ValueError(f"Invalid local URL: {local_url}")
-                host, tunnel_port = m.group(1), int(m.group(2))
-                public_url, tunnel_handle = Tunnel.start_tunnel(host, tunnel_port)
+            # 3) Handle transport-specific setup
+            tunnel_handle = None
+            local_url = None
+            public_url = None
 
+            if transport == "stdio":
+                # For stdio, run in main thread (blocking)
                 self._logger.info(
-                    "tunnel_started",
-                    type="tunnel_started",
-                    public_url=public_url,
+                    "mcp_stdio_starting",
+                    type="mcp_stdio_starting",
+                    mounted={
+                        "current_repo": bool(current_repo),
+                        "previous_repo": bool(previous_repo),
+                    },
                 )
-            else:
-                self._logger.info(
-                    "tunnel_skipped",
-                    type="tunnel_skipped",
-                    reason="use_tunnel=False",
+
+                # Build context (no cleanup needed for stdio)
+                ctx = MCPServerContext(
+                    transport="stdio",
+                    local_url=None,
+                    public_url=None,
+                    has_current=bool(current_repo),
+                    has_previous=bool(previous_repo),
+                    batch_tool=BATCH_TOOL_NAME,
                 )
 
-            # 5) Build context with cleanup
-            ctx = MCPServerContext(
-                transport="streamable-http",
-                local_url=local_url,
-                public_url=public_url,
-                has_current=bool(current_repo),
-                has_previous=bool(previous_repo),
-            )
+                # Run will block - this is intentional for stdio mode
+                app.run(transport="stdio")
+
+                return ctx
+
+            else:  # streamable-http
+                # Start aggregator in daemon thread
+                def run_app() -> None:
+                    app.run(transport="streamable-http", port=port)
 
-            def cleanup() -> None:
-                self._logger.info("mcp_cleanup_start")
-                if tunnel_handle is not None:
-                    try:
-                        tunnel_handle.stop_tunnel()
-                    except Exception:
-                        self._logger.exception("tunnel_stop_error")
-                # FastMCP has no shutdown API; daemon thread will exit on process end
-                self._logger.info("mcp_cleanup_done")
-
-            ctx.cleanup = cleanup
-            return ctx
+                thread = threading.Thread(target=run_app, daemon=True)
+                thread.start()
+                local_url = f"http://{host}:{port}"
+
+                self._logger.info(
+                    "aggregator_started",
+                    type="aggregator_started",
+                    transport="streamable-http",
+                    local_url=local_url,
+                    mounted={
+                        "current_repo": bool(current_repo),
+                        "previous_repo": bool(previous_repo),
+                    },
+                )
+
+                # 4) Collect the tunnel started above (optional for streamable-http)
+                if tunnel_future is not None:
+                    public_url, tunnel_handle = tunnel_future.result()
+
+                    self._logger.info(
+                        "tunnel_started",
+                        type="tunnel_started",
+                        public_url=public_url,
+                    )
+                else:
+                    self._logger.info(
+                        "tunnel_skipped",
+                        type="tunnel_skipped",
+                        reason="use_tunnel=False",
+                    )
+
+                # 5) Build context with cleanup
+                def cleanup() -> None:
+                    self._logger.info("mcp_cleanup_start")
+                    if tunnel_handle is not None:
+                        try:
+                            tunnel_handle.stop_tunnel()
+                        except Exception:
+                            self._logger.exception("tunnel_stop_error")
+                    # FastMCP has no shutdown API; daemon thread will exit on process end
+                    self._logger.info("mcp_cleanup_done")
+
+                ctx = MCPServerContext(
+                    transport="streamable-http",
+                    local_url=local_url,
+                    public_url=public_url,
+                    has_current=bool(current_repo),
+                    has_previous=bool(previous_repo),
+                    batch_tool=BATCH_TOOL_NAME,
+                    cleanup=cleanup,
+                )
+                # The context's cleanup owns the tunnel from here on
+                handed_off = True
+                return ctx
+        finally:
+            if tunnel_future is not None and not handed_off:
+                tunnel_future.add_done_callback(_stop_started_tunnel)
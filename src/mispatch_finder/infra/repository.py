@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import shutil
+from contextlib import AbstractContextManager
 from pathlib import Path
 
 from git import Repo
+from git.exc import InvalidGitRepositoryError, NoSuchPathError
 
 from ..core.ports import RepositoryPort
+from ..shared.file_lock import file_lock
 
 
 class Repository:
@@ -19,22 +22,40 @@ class Repository:
         commit: str,
         force_reclone: bool,
     ) -> tuple[Path | None, Path | None]:
-        """Clone repo and prepare current/previous workdirs."""
-        base = self._ensure_repo(repo_url, force_reclone)
+        """Clone repo and prepare current/previous workdirs.
+
+        Safe to call from several threads and processes (batch prefetch runs
+        alongside analyze subprocesses): each workdir is guarded by a lock file,
+        so a clone/copy/checkout is never observed half-done.
+        """
+        base = self._cache_dir / "repos" / self._repo_slug(repo_url)
+        with self._lock_for(base):
+            return self._prepare_workdirs(base, repo_url=repo_url, commit=commit, force_reclone=force_reclone)
+
+    def _prepare_workdirs(
+        self,
+        base: Path,
+        *,
+        repo_url: str,
+        commit: str,
+        force_reclone: bool,
+    ) -> tuple[Path | None, Path | None]:
+        self._ensure_repo(base, repo_url, force_reclone)
         repo = Repo(base)
 
         # current = base repo at HEAD
         current = base
 
-        # previous = copy at parent of target commit
+        # previous = worktree at parent of target commit
         commit_obj = repo.commit(commit)
         parent = commit_obj.parents[0] if commit_obj.parents else None
 
         if parent is not None:
             work_base = self._cache_dir / "worktrees"
             previous = work_base / f"{base.name}-{commit[:12]}-previous"
-            previous_repo = self._copy_repo(base, previous, overwrite=force_reclone)
-            previous_repo.git.checkout(parent.hexsha)
+            # Lock order is always base -> previous; get_diff takes only one
+            with self._lock_for(previous):
+                self._add_worktree(repo, previous, parent.hexsha, overwrite=force_reclone)
         else:
             previous = None
 
@@ -42,31 +63,54 @@ class Repository:
 
     def get_diff(self, *, workdir: Path, commit: str) -> str:
         """Return unified diff for commit against its parent."""
-        repo = Repo(workdir)
-        commit_obj = repo.commit(commit)
-        if not commit_obj.parents:
-            return ""
-        parent = commit_obj.parents[0]
-        return repo.git.diff(f"{parent.hexsha}..{commit_obj.hexsha}")
+        # Locked: a blobless clone fetches missing blobs into its .git here
+        with self._lock_for(workdir):
+            repo = Repo(workdir)
+            commit_obj = repo.commit(commit)
+            if not commit_obj.parents:
+                return ""
+            parent = commit_obj.parents[0]
+            return repo.git.diff(f"{parent.hexsha}..{commit_obj.hexsha}")
 
-    def _ensure_repo(self, repo_url: str, force_reclone: bool) -> Path:
+    @staticmethod
+    def _lock_for(workdir: Path) -> AbstractContextManager[None]:
+        # Sibling lock file: survives the workdir itself being removed/recloned
+        return file_lock(workdir.with_name(f"{workdir.name}.lock"))
+
+    @staticmethod
+    def _repo_slug(repo_url: str) -> str:
         slug = repo_url.rstrip("/").split("/")[-1]
         if slug.endswith(".git"):
             slug = slug[:-4]
-        base = self._cache_dir / "repos" / slug
+        return slug
+
+    @staticmethod
+    def _ensure_repo(base: Path, repo_url: str, force_reclone: bool) -> None:
         if force_reclone and base.exists():
             shutil.rmtree(base)
         if not base.exists():
             base.parent.mkdir(parents=True, exist_ok=True)
-            Repo.clone_from(repo_url, base)
-        return base
+            # Blobless partial clone: full commit history (needed for parent
+            # lookup and diffs) but file contents are fetched only on checkout/diff
+            Repo.clone_from(repo_url, base, filter="blob:none")
+
+    @staticmethod
+    def _add_worktree(repo: Repo, dst: Path, sha: str, *, overwrite: bool) -> None:
+        """Check ``sha`` out into ``dst`` as a detached worktree of ``repo``.
 
-    def _copy_repo(self, src: Path, dst: Path, *, overwrite: bool) -> Repo:
+        A worktree shares the base clone's object store, so only the checked-out
+        files are written instead of a full copy of ``.git``.
+        """
+        if dst.exists() and not overwrite:
+            try:
+                Repo(dst).git.checkout(sha)
+                return
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                # Worktree of a since-recloned base: its .git link is dangling
+                pass
         if dst.exists():
-            if overwrite:
-                shutil.rmtree(dst)
-            else:
-                return Repo(dst)
+            shutil.rmtree(dst)
         dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(src, dst)
-        return Repo(dst)
+        # Drop registrations of worktrees whose directories are gone
+        repo.git.worktree("prune")
+        repo.git.worktree("add", "--detach", str(dst), sha)
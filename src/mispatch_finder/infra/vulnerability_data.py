@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Iterator
+from typing import Collection, Iterator
 
 import cve_collector.core.domain.models as cve_models
 from cve_collector import CveCollectorClient
@@ -12,13 +12,14 @@ from ..core.domain.exceptions import GHSANotFoundError
 from ..core.domain.models import Repository, Vulnerability
 from ..core.ports import VulnerabilityDataPort
 
+_GHSA_RE = re.compile(r"^GHSA-[A-Za-z0-9_-]+-[A-Za-z0-9_-]+-[A-Za-z0-9_-]+$")
+_COMMIT_RE = re.compile(r"[0-9a-fA-F]{7,40}")
+
 
 def _choose_commit(commits: list[str]) -> str | None:
     """Select the most complete commit hash from a list of candidates."""
-    valid = [c for c in commits if re.fullmatch(r"[0-9a-fA-F]{7,40}", c)]
-    if not valid:
-        return None
-    return max(valid, key=len)
+    is_commit = _COMMIT_RE.fullmatch
+    return max((c for c in commits if is_commit(c)), key=len, default=None)
 
 
 class VulnerabilityDataAdapter(VulnerabilityDataPort):
@@ -151,8 +152,6 @@ class VulnerabilityDataAdapter(VulnerabilityDataPort):
             list[str] if detailed=False (GHSA IDs only)
             list[Vulnerability] if detailed=True (full domain models)
         """
-        ghsa_re = re.compile(r"^GHSA-[A-Za-z0-9_-]+-[A-Za-z0-9_-]+-[A-Za-z0-9_-]+$")
-
         vulns = self._client.list_vulnerabilities(
             ecosystem=ecosystem,
             limit=limit,
@@ -166,7 +165,7 @@ class VulnerabilityDataAdapter(VulnerabilityDataPort):
             seen: set[str] = set()
             for cve_vuln in vulns:
                 ghsa = cve_vuln.ghsa_id
-                if ghsa_re.match(ghsa) and ghsa not in seen:
+                if _GHSA_RE.match(ghsa) and ghsa not in seen:
                     seen.add(ghsa)
                     items.append(ghsa)
             return items
@@ -176,7 +175,7 @@ class VulnerabilityDataAdapter(VulnerabilityDataPort):
             seen_ids: set[str] = set()
             for cve_vuln in vulns:
                 ghsa = cve_vuln.ghsa_id
-                if not ghsa_re.match(ghsa) or ghsa in seen_ids:
+                if not _GHSA_RE.match(ghsa) or ghsa in seen_ids:
                     continue
                 seen_ids.add(ghsa)
 
@@ -190,6 +189,7 @@ class VulnerabilityDataAdapter(VulnerabilityDataPort):
         ecosystem: str = "npm",
         detailed: bool = False,
         filter_expr: str | None = None,
+        exclude_ids: Collection[str] = (),
     ) -> Iterator[str] | Iterator[Vulnerability]:
         """Iterate over vulnerabilities lazily.
 
@@ -197,13 +197,16 @@ class VulnerabilityDataAdapter(VulnerabilityDataPort):
             ecosystem: Ecosystem to filter by (npm, pypi, go, etc.)
             detailed: If True, yield full Vulnerability objects; if False, yield GHSA IDs only
             filter_expr: Optional asteval filter expression for filtering results
+            exclude_ids: GHSA IDs to skip before conversion to domain models
 
         Yields:
             str if detailed=False (GHSA IDs)
             Vulnerability if detailed=True (full domain models)
         """
-        ghsa_re = re.compile(r"^GHSA-[A-Za-z0-9_-]+-[A-Za-z0-9_-]+-[A-Za-z0-9_-]+$")
         seen: set[str] = set()
+        # Loop-invariant lookups bound once instead of per item
+        mark_seen = seen.add
+        is_ghsa = _GHSA_RE.match
 
         for cve_vuln in self._client.list_vulnerabilities_iter(
             ecosystem=ecosystem,
@@ -211,9 +214,9 @@ class VulnerabilityDataAdapter(VulnerabilityDataPort):
             filter_expr=filter_expr,
         ):
             ghsa = cve_vuln.ghsa_id
-            if not ghsa_re.match(ghsa) or ghsa in seen:
+            if ghsa in exclude_ids or ghsa in seen or not is_ghsa(ghsa):
                 continue
-            seen.add(ghsa)
+            mark_seen(ghsa)
 
             if not detailed:
                 yield ghsa
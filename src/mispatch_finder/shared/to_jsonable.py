@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+from dataclasses import fields
 
 
 def to_jsonable(obj):
@@ -34,7 +34,8 @@ def to_jsonable(obj):
     elif hasattr(obj, 'dict'):  # Pydantic v1
         return to_jsonable(obj.dict())
     elif hasattr(obj, '__dataclass_fields__'):  # Dataclass
-        return to_jsonable(asdict(obj))
+        # Walk fields directly; asdict() would deep-copy before we walk it again
+        return {f.name: to_jsonable(getattr(obj, f.name)) for f in fields(obj)}
     elif hasattr(obj, 'to_jsonable'):
         return obj.to_jsonable()
     elif hasattr(obj, '__dict__'):
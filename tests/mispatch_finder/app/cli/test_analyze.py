@@ -89,6 +89,50 @@ def test_analyze_accepts_provider_and_model_options(monkeypatch):
     assert "provider" not in result.stderr.lower() or result.exit_code != 2
 
 
+def _capture_llm_config(monkeypatch) -> dict:
+    """Stop analyze at container creation and record the LLM config it got."""
+    import mispatch_finder.app.cli as cli_module
+
+    captured: dict = {}
+
+    def fake_create_container(config, **kwargs):
+        captured["llm"] = config.llm
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(cli_module, "_create_container", fake_create_container)
+    return captured
+
+
+def test_analyze_keeps_env_provider_and_model_without_options(tmp_path, monkeypatch):
+    """Test that env-configured provider/model are not replaced by CLI defaults."""
+    monkeypatch.setenv("MISPATCH_FINDER_DIRECTORIES__HOME", str(tmp_path))
+    monkeypatch.setenv("MISPATCH_FINDER_LLM__API_KEY", "sk-test")
+    monkeypatch.setenv("MISPATCH_FINDER_GITHUB__TOKEN", "ghp-test")
+    monkeypatch.setenv("MISPATCH_FINDER_LLM__PROVIDER_NAME", "anthropic")
+    monkeypatch.setenv("MISPATCH_FINDER_LLM__MODEL_NAME", "claude-x")
+    captured = _capture_llm_config(monkeypatch)
+
+    runner.invoke(app, ["analyze", "GHSA-TEST"])
+
+    assert captured["llm"].provider_name == "anthropic"
+    assert captured["llm"].model_name == "claude-x"
+
+
+def test_analyze_options_override_env_provider_and_model(tmp_path, monkeypatch):
+    """Test that explicit --provider/--model take precedence over env config."""
+    monkeypatch.setenv("MISPATCH_FINDER_DIRECTORIES__HOME", str(tmp_path))
+    monkeypatch.setenv("MISPATCH_FINDER_LLM__API_KEY", "sk-test")
+    monkeypatch.setenv("MISPATCH_FINDER_GITHUB__TOKEN", "ghp-test")
+    monkeypatch.setenv("MISPATCH_FINDER_LLM__PROVIDER_NAME", "anthropic")
+    monkeypatch.setenv("MISPATCH_FINDER_LLM__MODEL_NAME", "claude-x")
+    captured = _capture_llm_config(monkeypatch)
+
+    runner.invoke(app, ["analyze", "GHSA-TEST", "--model", "claude-y"])
+
+    assert captured["llm"].provider_name == "anthropic"
+    assert captured["llm"].model_name == "claude-y"
+
+
 def test_analyze_accepts_force_reclone(monkeypatch):
     """Test that analyze command accepts --force-reclone flag."""
     monkeypatch.setenv("MISPATCH_FINDER_LLM__API_KEY", "sk-test")
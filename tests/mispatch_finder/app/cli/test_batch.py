@@ -1,23 +1,133 @@
 """Tests for 'batch' CLI command."""
 import pytest
+from dependency_injector import providers
+from typer.testing import CliRunner
 
-# TODO: Add batch command tests
-# Currently batch is a CLI-only orchestration command that spawns subprocess calls to analyze
-#
-# Challenges for testing:
-# - Spawns actual subprocess (sys.executable + mispatch_finder.app.cli analyze)
-# - Requires integration with real vulnerability data
-# - Needs proper mocking of subprocess.run()
-#
-# Tests should verify:
-# - Correct subprocess invocations with proper arguments
-# - Handling of --provider and --model options (passed to subprocess)
-# - --limit functionality (stops after N successful runs)
-# - --filter and --no-filter functionality
-# - Error handling when subprocess fails
-# - Progress output and status messages
-#
-# Recommended approach:
-# - Mock subprocess.run() to avoid actual execution
-# - Mock ListUseCase to return fake vulnerability list
-# - Verify subprocess.run() called with correct command arguments
+from mispatch_finder.app import cli
+from mispatch_finder.app.container import Container
+from mispatch_finder.infra.mcp.tunnel import Tunnel
+from tests.mispatch_finder.app.conftest import MockVulnerabilityRepository
+
+runner = CliRunner()
+
+
+class RecordingRepository:
+    """Repository stub that records which commits were prepared."""
+
+    def __init__(self, **kwargs):
+        self.prepared: list[str] = []
+
+    def prepare_workdirs(self, *, repo_url: str, commit: str, force_reclone: bool):
+        self.prepared.append(commit)
+        return None, None
+
+
+class SharedTunnel:
+    """Tunnel stub that stays alive until stopped."""
+
+    def __init__(self):
+        self.stopped = False
+
+    def is_alive(self):
+        return not self.stopped
+
+    def stop_tunnel(self):
+        self.stopped = True
+
+
+def test_batch_prefetches_workdirs_before_each_run(tmp_path, test_config, monkeypatch):
+    """Test that each candidate's workdirs are prepared before its analyze subprocess runs."""
+    repo = RecordingRepository()
+    events: list[tuple[str, int]] = []
+
+    def create_mock_container():
+        c = Container()
+        c.config.from_pydantic(test_config)
+        c.vuln_data.override(providers.Singleton(MockVulnerabilityRepository, commit="abc1234"))
+        c.repo.override(providers.Object(repo))
+        return c
+
+    class FakeCompleted:
+        returncode = 0
+        stderr = ""
+
+    def fake_run(cmd, **kwargs):
+        events.append((cmd[-1], len(repo.prepared)))
+        return FakeCompleted()
+
+    monkeypatch.setattr(Tunnel, "start_tunnel", lambda host, port: ("http://shared.test", SharedTunnel()))
+    monkeypatch.setattr(cli, "Container", create_mock_container)
+    monkeypatch.setattr(cli, "AppConfig", lambda: test_config)
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    result = runner.invoke(cli.app, ["batch"])
+
+    assert result.exit_code == 0, result.output
+    assert repo.prepared == ["abc1234", "abc1234"]
+    assert events[0][0] == "GHSA-1111-2222-3333"
+    assert events[0][1] >= 1  # its own prefetch finished before the run
+    assert "2 processed" in result.stdout
+
+
+def test_batch_shares_one_tunnel_across_runs(tmp_path, test_config, monkeypatch):
+    """Test that batch opens a single tunnel and hands its URL to every analyze subprocess."""
+    tunnels: list[SharedTunnel] = []
+    envs: list[str | None] = []
+
+    def fake_start_tunnel(host, port):
+        tunnels.append(SharedTunnel())
+        return "http://shared.test", tunnels[-1]
+
+    def create_mock_container():
+        c = Container()
+        c.config.from_pydantic(test_config)
+        c.vuln_data.override(providers.Singleton(MockVulnerabilityRepository, commit="abc1234"))
+        c.repo.override(providers.Object(RecordingRepository()))
+        return c
+
+    class FakeCompleted:
+        returncode = 0
+        stderr = ""
+
+    def fake_run(cmd, **kwargs):
+        envs.append(kwargs["env"].get("MISPATCH_FINDER_ANALYSIS__PUBLIC_URL"))
+        return FakeCompleted()
+
+    monkeypatch.setattr(Tunnel, "start_tunnel", fake_start_tunnel)
+    monkeypatch.setattr(cli, "Container", create_mock_container)
+    monkeypatch.setattr(cli, "AppConfig", lambda: test_config)
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    result = runner.invoke(cli.app, ["batch"])
+
+    assert result.exit_code == 0, result.output
+    assert len(tunnels) == 1
+    assert envs == ["http://shared.test", "http://shared.test"]
+    assert tunnels[0].stopped
+
+
+def test_batch_reports_tunnel_start_failure(tmp_path, test_config, monkeypatch):
+    """Test that a tunnel that fails to start ends batch with a CLI error, not a traceback."""
+    runs: list[list[str]] = []
+
+    def failing_start_tunnel(host, port):
+        raise RuntimeError("ssh not found")
+
+    def create_mock_container():
+        c = Container()
+        c.config.from_pydantic(test_config)
+        c.vuln_data.override(providers.Singleton(MockVulnerabilityRepository, commit="abc1234"))
+        c.repo.override(providers.Object(RecordingRepository()))
+        return c
+
+    monkeypatch.setattr(Tunnel, "start_tunnel", failing_start_tunnel)
+    monkeypatch.setattr(cli, "Container", create_mock_container)
+    monkeypatch.setattr(cli, "AppConfig", lambda: test_config)
+    monkeypatch.setattr(cli.subprocess, "run", lambda cmd, **kwargs: runs.append(cmd))
+
+    result = runner.invoke(cli.app, ["batch"])
+
+    assert result.exit_code == 1
+    assert "Failed to start tunnel: ssh not found" in result.stderr
+    assert not isinstance(result.exception, RuntimeError)
+    assert runs == []
@@ -93,8 +93,15 @@ class MockVulnerabilityRepository:
         ecosystem: str = "npm",
         detailed: bool = False,
         filter_expr: str | None = None,
+        exclude_ids=(),
     ) -> Iterator[str] | Iterator[Vulnerability]:
-        """Mock list_vulnerabilities_iter implementation."""
+        """Iterate over vulnerabilities lazily, skipping exclude_ids."""
+        for item in self._iter_all(detailed):
+            ghsa = item.ghsa_id if isinstance(item, Vulnerability) else item
+            if ghsa not in exclude_ids:
+                yield item
+
+    def _iter_all(self, detailed: bool) -> Iterator[str] | Iterator[Vulnerability]:
         if not detailed:
             yield "GHSA-1111-2222-3333"
             yield "GHSA-4444-5555-6666"
@@ -1,6 +1,7 @@
 """Tests for Pydantic BaseSettings configuration."""
 import pytest
 from pathlib import Path
+from pydantic import ValidationError
 
 from mispatch_finder.app.config import (
     AppConfig,
@@ -9,6 +10,7 @@ from mispatch_finder.app.config import (
     GitHubConfig,
     VulnerabilityConfig,
     AnalysisConfig,
+    RuntimeConfig,
 )
 
 
@@ -61,6 +63,7 @@ def test_vulnerability_config_defaults():
     assert config.ecosystem == "npm"
     assert "stars" in config.filter_expr
     assert "100" in config.filter_expr
+    assert config.list_default_limit == 10
 
 
 def test_analysis_config_defaults():
@@ -139,3 +142,90 @@ def test_directory_config_custom_home(tmp_path):
     assert config.cache_dir == custom_home / "cache"
     assert config.results_dir == custom_home / "results"
     assert config.logs_dir == custom_home / "logs"
+
+
+def test_directory_config_computed_paths_cached(tmp_path):
+    """Test that computed paths are resolved (and mkdir'd) only once per instance."""
+    config = DirectoryConfig(home=tmp_path)
+
+    first = config.logs_dir
+    first.rmdir()
+
+    # Cached: second access returns same object without re-creating the directory
+    assert config.logs_dir is first
+    assert not first.exists()
+
+
+def test_runtime_config_ignores_environment(monkeypatch):
+    """Test that RuntimeConfig is populated programmatically, never from env vars."""
+    monkeypatch.setenv("GHSA", "GHSA-FROM-ENV-0000")
+
+    config = RuntimeConfig()
+    assert config.ghsa is None
+
+    config.ghsa = "GHSA-TEST-1234-5678"
+    assert config.ghsa == "GHSA-TEST-1234-5678"
+
+
+def test_directory_config_creates_all_dirs_on_first_access(tmp_path):
+    """Test that accessing one computed path bootstraps all data directories."""
+    config = DirectoryConfig(home=tmp_path)
+
+    _ = config.cache_dir
+
+    assert (tmp_path / "results").is_dir()
+    assert (tmp_path / "logs").is_dir()
+
+
+def test_analysis_config_prevalidated_and_frozen():
+    """Test that diff_max_chars is validated at load time and immutable afterwards."""
+    with pytest.raises(ValidationError):
+        AnalysisConfig(diff_max_chars=0)
+
+    config = AnalysisConfig(diff_max_chars=1000)
+    with pytest.raises(ValidationError):
+        config.diff_max_chars = 2000
+
+
+def test_directory_config_creates_missing_home(tmp_path):
+    """Test that the directory bootstrap creates a missing (nested) home first."""
+    home = tmp_path / "nested" / "home"
+    config = DirectoryConfig(home=home)
+
+    assert config.logs_dir == home / "logs"
+    assert config.logs_dir.is_dir()
+
+
+def test_static_subconfigs_are_frozen(tmp_path):
+    """Test that env-derived subconfigs are immutable (runtime/logging stay mutable)."""
+    config = AppConfig(directories=DirectoryConfig(home=tmp_path))
+
+    with pytest.raises(ValidationError):
+        config.llm.model_name = "other"
+    with pytest.raises(ValidationError):
+        config.directories.home = tmp_path / "other"
+
+    # Cached computed paths still work on a frozen model
+    assert config.directories.cache_dir == tmp_path / "cache"
+
+
+def test_directory_config_expands_home(tmp_path, monkeypatch):
+    """Test that env vars and ~ in home are expanded once at load time."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("MF_TEST_SUBDIR", "data")
+
+    config = DirectoryConfig(home=Path("~/$MF_TEST_SUBDIR"))
+
+    assert config.home == tmp_path / "data"
+
+
+def test_directory_config_model_copy_recomputes_paths(tmp_path):
+    """Test that model_copy(update={"home": ...}) doesn't keep the old home's cached paths."""
+    original = DirectoryConfig(home=tmp_path / "a")
+    _ = original.cache_dir
+
+    copied = original.model_copy(update={"home": tmp_path / "b"})
+
+    assert copied.cache_dir == tmp_path / "b" / "cache"
+    assert copied.model_dump()["logs_dir"] == tmp_path / "b" / "logs"
+    assert original.cache_dir == tmp_path / "a" / "cache"
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from mispatch_finder.core.domain.models import RepoContext, AnalysisResult
+from mispatch_finder.core.domain.models import RepoContext, AnalysisResult, Repository, Vulnerability
 
 
 def test_repo_context_creation():
@@ -74,3 +74,40 @@ def test_analysis_result_with_none_fields():
     assert result.poc_idea is None
     assert result.raw_text is None
 
+
+
+def test_domain_models_use_slots():
+    repo = Repository(owner="test", name="repo")
+    vuln = Vulnerability(ghsa_id="GHSA-TEST-1234-5678", repository=repo, commit_hash="abc1234")
+
+    for obj in (repo, vuln):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_repository_slug_and_url_precomputed():
+    repo = Repository(owner="test", name="repo", star_count=5)
+
+    assert repo.slug == "test/repo"
+    assert repo.url == "https://github.com/test/repo"
+    assert repo == Repository(owner="test", name="repo", star_count=5)
+
+
+def test_analysis_result_to_dict_is_shallow():
+    evidence = [{"type": "test"}]
+    result = AnalysisResult(
+        ghsa="GHSA-TEST-1234-5678",
+        provider="openai",
+        model="gpt-4",
+        verdict="good",
+        severity="low",
+        rationale="r",
+        evidence=evidence,
+        poc_idea=None,
+        raw_text="{}",
+    )
+
+    data = result.to_dict()
+
+    assert data["ghsa"] == "GHSA-TEST-1234-5678"
+    assert data["raw_text"] == "{}"
+    assert data["evidence"] is evidence
@@ -69,3 +69,17 @@ def test_build_prompt_both_unavailable():
     # Should mention both states
     assert "Previous-state tools" in prompt
     assert "Current-state tools" in prompt
+
+
+def test_build_prompt_mentions_batch_tool_only_when_given():
+    kwargs = dict(
+        ghsa="GHSA-xxxx-xxxx-xxxx",
+        repo_url="https://github.com/test/test",
+        commit="abc123",
+        has_previous=True,
+        has_current=True,
+        diff_text="",
+    )
+
+    assert "single 'bundle' call" in build_prompt(**kwargs, batch_tool="bundle")
+    assert "several reads at once" not in build_prompt(**kwargs)
@@ -57,6 +57,33 @@ class TestDiffService:
         assert result.included_len < result.full_len
         assert "..." in result.truncated_text
 
+    def test_generate_diff_truncation_aligns_to_lines(self):
+        """Test that middle truncation cuts only at line boundaries."""
+        lines = [f"+line {i:04d}" for i in range(200)]
+        repo = FakeRepo(diff_content="\n".join(lines) + "\n")
+        service = DiffService(repo=repo, max_chars=100)
+
+        result = service.generate_diff(workdir=Path("/test"), commit="abc123")
+
+        head, tail = result.truncated_text.split("\n...\n")
+        assert result.was_truncated is True
+        assert result.included_len <= 100 + len("\n...\n")
+        assert all(line in lines for line in head.splitlines() if line)
+        assert all(line in lines for line in tail.splitlines())
+        assert tail.endswith("+line 0199\n")
+
+    def test_generate_diff_truncation_keeps_budget_on_long_lines(self):
+        """Test that a huge single line (minified bundle) doesn't collapse the kept text."""
+        diff = "diff --git a/app.min.js b/app.min.js\n+" + "x" * 300_000 + "\n"
+        repo = FakeRepo(diff_content=diff)
+        service = DiffService(repo=repo, max_chars=200_000)
+
+        result = service.generate_diff(workdir=Path("/test"), commit="abc123")
+
+        assert result.was_truncated is True
+        assert result.included_len >= 200_000 - 2048
+        assert result.included_len <= 200_000 + len("\n...\n")
+
     def test_generate_diff_with_none_workdir(self):
         """Test diff generation with None workdir."""
         repo = FakeRepo()
@@ -68,6 +95,18 @@ class TestDiffService:
         assert result.truncated_text == ""
         assert result.full_len == 0
         assert result.was_truncated is False
+        assert service.generate_diff(workdir=None, commit="def456") is result
+
+    def test_generate_text_matches_generate_diff(self):
+        """Test that the text-only path returns the same truncated text."""
+        lines = [f"+line {i:04d}" for i in range(200)]
+        repo = FakeRepo(diff_content="\n".join(lines) + "\n")
+        service = DiffService(repo=repo, max_chars=100)
+
+        text = service.generate_text(workdir=Path("/test"), commit="abc123")
+
+        assert text == service.generate_diff(workdir=Path("/test"), commit="abc123").truncated_text
+        assert service.generate_text(workdir=None, commit="abc123") == ""
 
 
 class TestJsonExtractor:
@@ -95,6 +134,23 @@ class TestJsonExtractor:
         assert "status" in result
         assert "ok" in result
 
+    def test_extract_bare_json_with_whitespace(self):
+        """Test that a response that is only a JSON object is returned re-serialized."""
+        extractor = JsonExtractor()
+
+        result = extractor.extract('\n  {"status":"ok","note":"```json in text"}\n')
+
+        assert result == '{"status": "ok", "note": "```json in text"}'
+
+    def test_extract_json_fence_ignores_surrounding_braces(self):
+        """Test that a ```json fence wins over braces in the surrounding prose."""
+        extractor = JsonExtractor()
+        text = 'Checked {file} first.\n```json\n{"status": "ok"}\n```\nSee {notes}.'
+
+        result = extractor.extract(text)
+
+        assert result == '{"status": "ok"}'
+
     def test_extract_no_json(self):
         """Test extraction when no JSON is present."""
         extractor = JsonExtractor()
@@ -115,6 +171,16 @@ class TestJsonExtractor:
         # Should return original text when parsing fails
         assert result == text
 
+    def test_extract_object_returns_parsed(self):
+        """Test that extract_object returns the formatted text and the parsed dict."""
+        extractor = JsonExtractor()
+
+        text, parsed = extractor.extract_object('Answer:\n```json\n{"reason": "x"}\n```')
+
+        assert text == '{"reason": "x"}'
+        assert parsed == {"reason": "x"}
+        assert extractor.extract_object("no json") == ("no json", None)
+
 
 class FakeVulnRepo:
     """Fake vulnerability repository."""
@@ -184,6 +250,9 @@ class FakeLogger:
     def exception(self, message: str, **kwargs) -> None:
         pass
 
+    def is_enabled_for(self, level: str) -> bool:
+        return True
+
 
 class TestAnalysisOrchestrator:
     """Tests for AnalysisOrchestrator."""
@@ -253,3 +322,143 @@ class TestAnalysisOrchestrator:
 
         # Cleanup should still be called
         assert mcp.cleanup_called
+
+    def test_orchestrator_cleanup_on_diff_error(self):
+        """Test that MCP started alongside a failing diff is still cleaned up."""
+        class ErrorRepo(FakeRepo):
+            def get_diff(self, *, workdir: Path, commit: str) -> str:
+                raise RuntimeError("diff error")
+
+        repo = ErrorRepo()
+        mcp = FakeMCP()
+
+        orchestrator = AnalysisOrchestrator(
+            vuln_data=FakeVulnRepo(),
+            repo=repo,
+            mcp=mcp,
+            llm=FakeLLM(),
+            token_gen=FakeTokenGen(),
+            logger=FakeLogger(),
+            diff_service=DiffService(repo=repo, max_chars=1000),
+            json_extractor=JsonExtractor(),
+            mcp_port=18080,
+        )
+
+        with pytest.raises(RuntimeError, match="diff error"):
+            orchestrator.analyze(ghsa="GHSA-TEST-1234", force_reclone=False)
+
+        assert mcp.cleanup_called
+
+    def test_orchestrator_skips_token_when_metadata_fails(self):
+        """Test that no MCP token is generated if the run fails before MCP startup."""
+        class ErrorVulnRepo:
+            def fetch_metadata(self, ghsa: str) -> Vulnerability:
+                raise RuntimeError("fetch error")
+
+        class CountingTokenGen(FakeTokenGen):
+            calls = 0
+
+            def generate(self) -> str:
+                CountingTokenGen.calls += 1
+                return super().generate()
+
+        repo = FakeRepo()
+        orchestrator = AnalysisOrchestrator(
+            vuln_data=ErrorVulnRepo(),
+            repo=repo,
+            mcp=FakeMCP(),
+            llm=FakeLLM(),
+            token_gen=CountingTokenGen(),
+            logger=FakeLogger(),
+            diff_service=DiffService(repo=repo, max_chars=1000),
+            json_extractor=JsonExtractor(),
+            mcp_port=18080,
+        )
+
+        with pytest.raises(RuntimeError, match="fetch error"):
+            orchestrator.analyze(ghsa="GHSA-TEST-1234", force_reclone=False)
+
+        assert CountingTokenGen.calls == 0
+
+    def test_orchestrator_maps_legacy_fields(self):
+        """Test fallback keys (rationale, poc_idea) and dict evidence wrapping."""
+        class LegacyLLM:
+            def call(self, *, prompt: str, mcp_url: str, mcp_token: str) -> str:
+                return (
+                    '{"current_risk": 1, "patch_risk": "high", "rationale": "old", '
+                    '"poc_idea": "curl x", "evidence": {"file": "a.js"}}'
+                )
+
+        repo = FakeRepo()
+        orchestrator = AnalysisOrchestrator(
+            vuln_data=FakeVulnRepo(),
+            repo=repo,
+            mcp=FakeMCP(),
+            llm=LegacyLLM(),
+            token_gen=FakeTokenGen(),
+            logger=FakeLogger(),
+            diff_service=DiffService(repo=repo, max_chars=1000),
+            json_extractor=JsonExtractor(),
+            mcp_port=18080,
+        )
+
+        result = orchestrator.analyze(ghsa="GHSA-TEST-1234", force_reclone=False)
+
+        assert result.verdict is None  # non-string current_risk is ignored
+        assert result.severity == "high"
+        assert result.rationale == "old"
+        assert result.poc_idea == "curl x"
+        assert result.evidence == [{"file": "a.js"}]
+
+    def test_orchestrator_uses_configured_public_url(self):
+        """Test that a pre-established public URL replaces the per-run tunnel."""
+        class RecordingLLM(FakeLLM):
+            mcp_url = None
+
+            def call(self, *, prompt: str, mcp_url: str, mcp_token: str) -> str:
+                RecordingLLM.mcp_url = mcp_url
+                return super().call(prompt=prompt, mcp_url=mcp_url, mcp_token=mcp_token)
+
+        repo = FakeRepo()
+        mcp = FakeMCP()
+        orchestrator = AnalysisOrchestrator(
+            vuln_data=FakeVulnRepo(),
+            repo=repo,
+            mcp=mcp,
+            llm=RecordingLLM(),
+            token_gen=FakeTokenGen(),
+            logger=FakeLogger(),
+            diff_service=DiffService(repo=repo, max_chars=1000),
+            json_extractor=JsonExtractor(),
+            mcp_port=18080,
+            public_url="https://shared.example.com",
+        )
+
+        orchestrator.analyze(ghsa="GHSA-TEST-1234", force_reclone=False)
+
+        assert mcp.last_use_tunnel is False
+        assert RecordingLLM.mcp_url == "https://shared.example.com/mcp"
+
+    def test_orchestrator_plain_text_response_leaves_fields_empty(self):
+        """Test that a non-JSON LLM answer yields a result with no parsed fields."""
+        class ProseLLM:
+            def call(self, *, prompt: str, mcp_url: str, mcp_token: str) -> str:
+                return "I could not determine the risk."
+
+        repo = FakeRepo()
+        orchestrator = AnalysisOrchestrator(
+            vuln_data=FakeVulnRepo(),
+            repo=repo,
+            mcp=FakeMCP(),
+            llm=ProseLLM(),
+            token_gen=FakeTokenGen(),
+            logger=FakeLogger(),
+            diff_service=DiffService(repo=repo, max_chars=1000),
+            json_extractor=JsonExtractor(),
+            mcp_port=18080,
+        )
+
+        result = orchestrator.analyze(ghsa="GHSA-TEST-1234", force_reclone=False)
+
+        assert (result.verdict, result.severity, result.rationale, result.evidence, result.poc_idea) == (None,) * 5
+        assert result.raw_text == "I could not determine the risk."
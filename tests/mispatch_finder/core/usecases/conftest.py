@@ -74,9 +74,16 @@ class FakeVulnRepo:
         ecosystem: str = "npm",
         detailed: bool = False,
         filter_expr: str | None = None,
+        exclude_ids=(),
     ) -> Iterator[str] | Iterator[Vulnerability]:
-        """Iterate over vulnerabilities lazily."""
+        """Iterate over vulnerabilities lazily, skipping exclude_ids."""
         self.listed_iter.append((ecosystem, detailed, filter_expr))
+        for item in self._iter_all(detailed):
+            ghsa = item.ghsa_id if isinstance(item, Vulnerability) else item
+            if ghsa not in exclude_ids:
+                yield item
+
+    def _iter_all(self, detailed: bool) -> Iterator[str] | Iterator[Vulnerability]:
         if not detailed:
             yield "GHSA-1111-2222-3333"
             yield "GHSA-4444-5555-6666"
@@ -216,6 +223,9 @@ class FakeLogger:
     def exception(self, message: str, **kwargs) -> None:
         pass
 
+    def is_enabled_for(self, level: str) -> bool:
+        return True
+
 
 from mispatch_finder.core.services.diff_service import DiffService
 
@@ -238,3 +248,6 @@ class FakeDiffService(DiffService):
             included_len=len(diff_text),
             was_truncated=False,
         )
+
+    def generate_text(self, *, workdir: Path | None, commit: str) -> str:
+        return self.generate_diff(workdir=workdir, commit=commit).truncated_text
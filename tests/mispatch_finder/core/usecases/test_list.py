@@ -86,3 +86,15 @@ def test_list_usecase_excludes_analyzed():
     # Should only return GHSA-4444-5555-6666 (not analyzed)
     assert result == ["GHSA-4444-5555-6666"]
     assert len(vuln_data.listed_iter) == 1
+
+
+def test_list_usecase_uses_injected_default_limit():
+    """Test that limit=None falls back to the injected default_limit."""
+    vuln_data = FakeVulnRepo()
+    analysis_store = FakeAnalysisStore()
+
+    uc = ListUseCase(vuln_data=vuln_data, analysis_store=analysis_store, default_limit=1)
+
+    result = uc.execute(ecosystem="npm", detailed=False, include_analyzed=True)
+
+    assert result == ["GHSA-1111-2222-3333"]
@@ -219,3 +219,32 @@ def test_parse_log_file_new_format(tmp_path):
     assert summary.reason == "New test reason"
     assert summary.done is True
 
+
+
+def test_parse_log_file_counts_only_tool_calls(tmp_path):
+    """Test that session setup and listing requests (e.g. from batch_execute's nested session) are not counted."""
+    log_file = tmp_path / "GHSA-CALLS.jsonl"
+
+    def request(method, name=None):
+        return {
+            "message": "mcp_request",
+            "type": "request",
+            "method": method,
+            "mcp_message": {"name": name} if name else {"method": method},
+        }
+
+    logs = [
+        request("initialize"),
+        request("notifications/initialized"),
+        request("tools/list"),
+        request("tools/call", "batch_execute"),
+        request("initialize"),  # nested in-memory session opened by batch_execute
+        request("tools/call", "current_repo_read"),
+        request("tools/call", "previous_repo_read"),
+    ]
+    log_file.write_text("\n".join(json.dumps(log) for log in logs) + "\n", encoding="utf-8")
+
+    summary = parse_log_file(log_file, verbose=True)
+
+    assert summary.mcp_total_calls == 3
+    assert summary.mcp_tool_counts == {"batch_execute": 1, "current_repo_read": 1, "previous_repo_read": 1}
@@ -0,0 +1,12 @@
+import pytest
+
+from mispatch_finder.infra.logging.logger import AnalysisLogger
+
+
+def test_is_enabled_for_known_and_unknown_levels(tmp_path):
+    logger = AnalysisLogger().init(logs_dir=tmp_path, logger_name="test-is-enabled-for", level="INFO")
+
+    assert logger.is_enabled_for("info") is True
+    assert logger.is_enabled_for("DEBUG") is False
+    with pytest.raises(ValueError, match="Unknown log level"):
+        logger.is_enabled_for("verbose")
@@ -111,3 +111,24 @@ def test_analysis_store_get_analyzed_ids_with_completed(tmp_path):
 
     # Should detect completed analysis based on log_summary logic
     assert isinstance(analyzed, set)
+
+
+def test_analysis_store_get_analyzed_ids_matches_summaries(tmp_path):
+    analysis_dir = tmp_path / "analysis"
+    analysis_dir.mkdir()
+
+    (analysis_dir / "GHSA-OLD.jsonl").write_text(
+        '{"message":"final_result","payload":{"type":"final_result"}}\n', encoding="utf-8"
+    )
+    (analysis_dir / "GHSA-NEW.jsonl").write_text(
+        '{"message":"final_result","type":"final_result","result":{}}\n', encoding="utf-8"
+    )
+    # Mentions final_result only inside a payload string: not a completed run
+    (analysis_dir / "GHSA-PENDING.jsonl").write_text(
+        '{"message":"mcp_response","type":"response","mcp_result":"\\"final_result\\""}\n',
+        encoding="utf-8",
+    )
+
+    store = AnalysisStore(analysis_dir=analysis_dir)
+
+    assert store.get_analyzed_ids() == {"GHSA-OLD", "GHSA-NEW"}
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from git import Repo
 
@@ -49,3 +50,49 @@ def test_repository_adapter_get_diff(tmp_path):
     assert "diff --git" in diff
     assert "+line2" in diff
 
+
+def test_repository_adapter_prepare_workdirs_concurrent_same_repo(tmp_path):
+    """Concurrent prepares of one repository serialize (via lock files) instead of racing the clone."""
+    repo_dir = tmp_path / "source"
+    repo = Repo.init(repo_dir)
+    (repo_dir / "a.txt").write_text("one", encoding="utf-8")
+    repo.index.add(["a.txt"])
+    repo.index.commit("first")
+    (repo_dir / "a.txt").write_text("two", encoding="utf-8")
+    repo.index.add(["a.txt"])
+    c2 = repo.index.commit("second").hexsha
+    repo.close()
+
+    adapter = Repository(cache_dir=tmp_path / "cache")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(adapter.prepare_workdirs, repo_url=str(repo_dir), commit=c2, force_reclone=False)
+            for _ in range(4)
+        ]
+        results = [f.result() for f in futures]
+
+    assert len(set(results)) == 1
+    _, previous = results[0]
+    assert (previous / "a.txt").read_text(encoding="utf-8") == "one"
+
+
+def test_repository_adapter_previous_is_worktree_and_survives_reclone(tmp_path):
+    """previous shares the base clone's object store and is rebuilt after a force reclone."""
+    repo_dir = tmp_path / "source"
+    repo = Repo.init(repo_dir)
+    (repo_dir / "a.txt").write_text("one", encoding="utf-8")
+    repo.index.add(["a.txt"])
+    repo.index.commit("first")
+    (repo_dir / "a.txt").write_text("two", encoding="utf-8")
+    repo.index.add(["a.txt"])
+    c2 = repo.index.commit("second").hexsha
+    repo.close()
+
+    adapter = Repository(cache_dir=tmp_path / "cache")
+    _, previous = adapter.prepare_workdirs(repo_url=str(repo_dir), commit=c2, force_reclone=False)
+
+    # A worktree has a .git file pointing into the base clone, not its own object store
+    assert (previous / ".git").is_file()
+
+    _, previous = adapter.prepare_workdirs(repo_url=str(repo_dir), commit=c2, force_reclone=True)
+    assert (previous / "a.txt").read_text(encoding="utf-8") == "one"
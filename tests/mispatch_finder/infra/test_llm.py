@@ -16,6 +16,9 @@ class FakeLogger:
     def exception(self, event_type, **kwargs):
         self.logs.append((event_type, kwargs))
 
+    def is_enabled_for(self, level):
+        return True
+
 
 def test_llm_initialization():
     logger = FakeLogger()
@@ -112,3 +115,65 @@ def test_llm_call_with_toolset(monkeypatch):
     assert captured_toolset[0].label == "mispatch_tools"
     assert captured_toolset[0].server_url == "http://localhost:8080"
     assert captured_toolset[0].bearer_token == "secret-token"
+
+
+def test_llm_call_skips_payload_logs_when_info_disabled(monkeypatch):
+    """Test that prompt/raw_text payloads are not logged when INFO is filtered out."""
+    class MockAdapter:
+        def run(self, prompt, toolset):
+            return LLMResponse(text="out", usage=None)
+
+    class QuietLogger(FakeLogger):
+        def is_enabled_for(self, level):
+            return False
+
+    monkeypatch.setattr(llm_module, "get_adapter", lambda provider, model, api_key: MockAdapter())
+
+    logger = QuietLogger()
+    llm = LLM(provider="openai", model="gpt-4", api_key="sk-test", logger=logger)
+    assert llm.call(prompt="p", mcp_url="http://localhost", mcp_token="token") == "out"
+
+    assert [event for event, _ in logger.logs if event in ("llm_input", "llm_output")] == []
+
+
+def test_llm_call_clips_large_log_payloads(monkeypatch):
+    """Test that prompt/raw_text in llm_input/llm_output logs are size-bounded."""
+    big = "x" * 20_000
+
+    class MockAdapter:
+        def run(self, prompt, toolset):
+            return LLMResponse(text=big, usage=None)
+
+    monkeypatch.setattr(llm_module, "get_adapter", lambda provider, model, api_key: MockAdapter())
+
+    logger = FakeLogger()
+    llm = LLM(provider="openai", model="gpt-4", api_key="sk-test", logger=logger)
+    assert llm.call(prompt=big, mcp_url="http://localhost", mcp_token="token") == big
+
+    logs = dict(logger.logs)
+    assert logs["llm_input"]["prompt_len"] == 20_000
+    assert len(logs["llm_input"]["prompt"]) < 9000
+    assert len(logs["llm_input"]["prompt_sha1"]) == 12
+    assert logs["llm_output"]["raw_text_len"] == 20_000
+    assert logs["llm_output"]["raw_text"].endswith("...<+11808>")
+
+
+def test_llm_reuses_adapter_across_calls(monkeypatch):
+    """Test that the provider adapter (and its HTTP client) is built once per LLM."""
+    created = []
+
+    class MockAdapter:
+        def run(self, prompt, toolset):
+            return LLMResponse(text="ok", usage=None)
+
+    def mock_get_adapter(provider, model, api_key):
+        created.append(provider)
+        return MockAdapter()
+
+    monkeypatch.setattr(llm_module, "get_adapter", mock_get_adapter)
+
+    llm = LLM(provider="openai", model="gpt-4", api_key="sk-test", logger=FakeLogger())
+    llm.call(prompt="a", mcp_url="http://localhost", mcp_token="token")
+    llm.call(prompt="b", mcp_url="http://localhost", mcp_token="token")
+
+    assert created == ["openai"]
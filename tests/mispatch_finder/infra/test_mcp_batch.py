@@ -0,0 +1,47 @@
+import asyncio
+
+from fastmcp import Client, FastMCP
+
+from mispatch_finder.infra.mcp.batch import register_batch_execute
+
+
+def _make_app() -> FastMCP:
+    app = FastMCP(name="test-aggregator")
+
+    @app.tool
+    def read(path: str) -> str:
+        return f"content:{path}"
+
+    @app.tool
+    def boom() -> str:
+        raise ValueError("bad")
+
+    register_batch_execute(app)
+    return app
+
+
+def test_batch_execute_runs_ops_in_order_with_per_op_errors():
+    app = _make_app()
+
+    async def run():
+        async with Client(app) as client:
+            result = await client.call_tool(
+                "batch_execute",
+                {
+                    "ops": [
+                        {"tool": "read", "args": {"path": "a.js"}},
+                        {"tool": "boom", "args": {}},
+                        {"tool": "batch_execute", "args": {}},
+                    ]
+                },
+            )
+            return result.structured_content["result"]
+
+    entries = asyncio.run(run())
+
+    assert [e["tool"] for e in entries] == ["read", "boom", "batch_execute"]
+    assert entries[0]["ok"] is True
+    assert "content:a.js" in str(entries[0]["result"])
+    assert entries[1]["ok"] is False
+    assert "bad" in str(entries[1]["error"])
+    assert entries[2] == {"tool": "batch_execute", "ok": False, "error": "batch_execute cannot be nested"}
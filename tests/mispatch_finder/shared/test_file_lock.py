@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import mispatch_finder
+from mispatch_finder.shared.file_lock import file_lock
+
+# Source root of the package under test, for the helper subprocess
+_SRC_DIR = str(Path(mispatch_finder.__file__).resolve().parents[1])
+
+
+def test_file_lock_excludes_other_processes(tmp_path):
+    lock_path = tmp_path / "repo.lock"
+    ready = tmp_path / "ready"
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import pathlib, sys, time\n"
+            "from mispatch_finder.shared.file_lock import file_lock\n"
+            "with file_lock(pathlib.Path(sys.argv[1])):\n"
+            "    pathlib.Path(sys.argv[2]).touch()\n"
+            "    time.sleep(0.5)\n",
+            str(lock_path),
+            str(ready),
+        ],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [_SRC_DIR, os.environ.get("PYTHONPATH")]))},
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not ready.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert ready.exists()
+
+        with file_lock(lock_path):
+            # Only acquired once the other process released it
+            assert holder.poll() is not None or holder.wait(timeout=5) == 0
+    finally:
+        holder.wait(timeout=10)
+
+
+def test_file_lock_creates_parent_dirs(tmp_path):
+    lock_path = tmp_path / "nested" / "a.lock"
+
+    with file_lock(lock_path):
+        assert lock_path.exists()